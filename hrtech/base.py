@@ -28,6 +28,8 @@ SECRET_KEY = SECRET_KEY
 INSTALLED_APPS = [
     'modules.users',
     'modules.teams',
+    'modules.jobs',
+    'modules.analytics',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -37,6 +39,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'hrtech.profiling.SamplingProfilerMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -125,3 +128,67 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Token activity tracking
+# last_used_at is buffered in memory and written in bulk by a background thread
+
+TOKEN_ACTIVITY_FLUSH_INTERVAL = 30  # seconds
+TOKEN_ACTIVITY_FLUSH_SIZE = 1000
+
+
+# Request profiling
+# Sampled requests are run under cProfile and dumped per route into DIR.
+# Summarize the dumps with `python manage.py profile_report`.
+
+PROFILING = {
+    "ENABLED": False,
+    "SAMPLE_RATE": 0.01,
+    "HEADER": "X-Profile",
+    "HEADER_TOKEN": None,
+    "ROUTES": [],
+    "DIR": BASE_DIR / "profiles",
+    "MAX_FILES_PER_ROUTE": 50,
+}
+
+
+# Cold start budget
+# Checked by the startup_report command and the cold start test; the first
+# request measures about 0.27s here, the budget leaves room for slower CI hosts
+
+STARTUP_PROBE_PATH = "/v1/users/me"
+STARTUP_BUDGET_SECONDS = 0.5
+
+
+# Team catalog
+# Teams are cached per process; the (max updated_at, count) stamp is checked at most this often
+
+TEAM_CATALOG_CHECK_INTERVAL = 5  # seconds
+
+
+# Background jobs
+# Run workers with `python manage.py run_jobs`; failed jobs are retried with exponential backoff
+
+JOBS = {
+    "MAX_ATTEMPTS": 3,
+    "BACKOFF_SECONDS": 10,
+    "MAX_BACKOFF_SECONDS": 600,
+    "LEASE_SECONDS": 300,
+    # Running jobs renew their lease this often, well inside LEASE_SECONDS
+    "HEARTBEAT_SECONDS": 60,
+}
+
+
+# HR analytics
+# Member counts are refreshed incrementally by the analytics.refresh job once they are older than the interval
+
+ANALYTICS = {
+    "REFRESH_INTERVAL_SECONDS": 300,
+    "WATERMARK_OVERLAP_SECONDS": 60,
+}
+
+
+# Tests
+# `python manage.py test` runs modules/<app>/tests/*_tests.py
+
+TEST_RUNNER = 'hrtech.test_runner.ModulesTestRunner'
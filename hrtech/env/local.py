@@ -8,5 +8,7 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': 'db.sqlite3',
+        # A file-backed test database lets threaded tests wait on locks instead of failing
+        'TEST': {'NAME': 'test_db.sqlite3'},
     },
 }
\ No newline at end of file
@@ -0,0 +1,75 @@
+import cProfile
+import os
+import random
+import re
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def profiles_dir() -> Path:
+    return Path(settings.PROFILING.get("DIR", settings.BASE_DIR / "profiles"))
+
+
+def route_slug(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    # Unresolved paths (404s, probes) share one directory instead of one each
+    if match is None:
+        return "unresolved"
+    return _UNSAFE.sub("_", match.route).strip("_") or "root"
+
+
+class SamplingProfilerMiddleware:
+    """
+    Profiles a sample of requests with cProfile and dumps one .pstats file
+    per request into ``PROFILING["DIR"]/<route>/``, keeping the newest
+    ``MAX_FILES_PER_ROUTE`` dumps. Removed from the stack when disabled.
+    """
+
+    def __init__(self, get_response):
+        options = getattr(settings, "PROFILING", {})
+        if not options.get("ENABLED"):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.sample_rate = options.get("SAMPLE_RATE", 0.0)
+        self.header = options.get("HEADER")
+        self.header_token = options.get("HEADER_TOKEN")
+        self.routes = [re.compile(pattern) for pattern in options.get("ROUTES", ())]
+        self.max_files = options.get("MAX_FILES_PER_ROUTE", 50)
+
+    def __call__(self, request):
+        if not self._should_profile(request):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active in this thread
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        self._dump(profiler, request)
+        return response
+
+    def _should_profile(self, request) -> bool:
+        if self.header and self.header_token and request.headers.get(self.header) == self.header_token:
+            return True
+        if any(pattern.search(request.path_info) for pattern in self.routes):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def _dump(self, profiler, request) -> None:
+        route_dir = profiles_dir() / route_slug(request)
+        route_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(route_dir / f"{time.time_ns()}-{os.getpid()}.pstats")
+
+        dumps = sorted(route_dir.glob("*.pstats"))
+        for stale in dumps[:-self.max_files]:
+            stale.unlink(missing_ok=True)
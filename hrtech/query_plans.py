@@ -0,0 +1,239 @@
+import json
+import re
+import uuid
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from modules.analytics.repository.analytics_repository import AnalyticsRepository
+from modules.jobs.domain.models import Job
+from modules.jobs.repository.jobs_repository import JobsRepository
+from modules.teams.domain.models import Role, Team, UserTeam
+from modules.teams.repository.team_catalog import team_catalog
+from modules.teams.repository.teammates_repository import TeammatesRepository
+from modules.teams.repository.teams_repository import TeamsRepository
+from modules.users.domain.models import User, UserAuthToken, birthday_key
+from modules.users.repository.user_auth_token_repository import UserAuthTokenRepository
+from modules.users.repository.users_repository import UsersRepository
+
+BASELINE_FILE = Path(__file__).resolve().parent / "query_plans.json"
+
+SEED_USERS = 300
+SEED_TEAMS = 20
+SEED_JOBS = 60
+
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+_NUMBERS = re.compile(r"\b\d+(\.\d+)?\b")
+_PG_COSTS = re.compile(r"\s*\(cost=[^)]*\)")
+
+
+def seed() -> dict:
+    """Fill the current database with a small directory and return probe values."""
+    teams = Team.objects.bulk_create(
+        Team(name=f"team-{i}", educational_institution_type="university", city_id=uuid.uuid4())
+        for i in range(SEED_TEAMS)
+    )
+    birth_dates = [date(1995 + i % 10, 1, 1) + timedelta(days=i) for i in range(SEED_USERS)]
+    users = User.objects.bulk_create(
+        User(
+            email=f"user{i}@example.com",
+            first_name="First",
+            last_name="Last",
+            password="!",
+            birth_date=birth_dates[i],
+            birthday_key=birthday_key(birth_dates[i]),
+            admission_year=2015 + i % 10,
+            faculty=f"faculty-{i % 7}",
+        )
+        for i in range(SEED_USERS)
+    )
+    UserTeam.objects.bulk_create(
+        UserTeam(user=user, team=teams[i % SEED_TEAMS]) for i, user in enumerate(users)
+    )
+    for team in teams:
+        TeammatesRepository.add_members(team.id, [user.id for user in users])
+    Role.objects.bulk_create(
+        Role(user=user, team=teams[i % SEED_TEAMS], role="developer") for i, user in enumerate(users)
+    )
+    tokens = UserAuthToken.objects.bulk_create(
+        UserAuthToken(user=user, token=str(uuid.uuid4())) for user in users
+    )
+    now = timezone.now()
+    jobs = Job.objects.bulk_create(
+        Job(kind="seed", status=("queued", "running", "succeeded")[i % 3], run_after=now) for i in range(SEED_JOBS)
+    )
+    facts = AnalyticsRepository.compute_facts(user.id for user in users)
+    AnalyticsRepository.replace_facts(facts, set())
+    AnalyticsRepository.apply_deltas(Counter((dimension, value) for _, dimension, value in facts))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return {"user": users[0], "users": users[:5], "team": teams[0], "token": tokens[0], "job": jobs[0]}
+
+
+def repository_queries(probe: dict) -> Dict[str, Callable]:
+    """
+    One entry per public repository method, run in this order against the
+    seeded database. RepositoryQueryPlansTest fails when a method is missing.
+    """
+    user, users, team, token, job = probe["user"], probe["users"], probe["team"], probe["token"], probe["job"]
+    user_ids = [member.id for member in users]
+    since = timezone.now() - timedelta(days=30)
+
+    def lock_state():
+        with transaction.atomic():
+            return AnalyticsRepository.lock_state()
+
+    return {
+        # Runs first so the remaining methods see a warm catalog
+        "TeamCatalog.reload": lambda: (team_catalog.clear(), team_catalog.get_many([team.id])),
+        "UsersRepository.get_by_id": lambda: UsersRepository.get_by_id(user.id),
+        "UsersRepository.get_by_email": lambda: UsersRepository.get_by_email(user.email),
+        "UsersRepository.get_for_sign_in": lambda: UsersRepository.get_for_sign_in(user.email),
+        "UsersRepository.get_many": lambda: UsersRepository.get_many(user_ids),
+        "UsersRepository.get_upcoming_birthdays": lambda: UsersRepository.get_upcoming_birthdays(1220, 110, 50),
+        "UsersRepository.get_cohort.admission_year": lambda: UsersRepository.get_cohort(
+            admission_year=user.admission_year, after=user.id
+        ),
+        "UsersRepository.get_cohort.faculty": lambda: UsersRepository.get_cohort(faculty=user.faculty),
+        "UsersRepository.save": lambda: UsersRepository.save(user),
+        "UserAuthTokenRepository.create": lambda: UserAuthTokenRepository.create(
+            UserAuthToken(user=user, token=str(uuid.uuid4()))
+        ),
+        "UserAuthTokenRepository.get_by_token": lambda: UserAuthTokenRepository.get_by_token(token.token),
+        "UserAuthTokenRepository.get_inactive": lambda: UserAuthTokenRepository.get_inactive(since),
+        "UserAuthTokenRepository.bulk_touch": lambda: UserAuthTokenRepository.bulk_touch(
+            {token.id: timezone.now()}
+        ),
+        "UserAuthTokenRepository.issue": lambda: UserAuthTokenRepository.issue(user.id, str(uuid.uuid4())),
+        "UserAuthTokenRepository.revoke_tokens": lambda: UserAuthTokenRepository.revoke_tokens(user.id),
+        "UserAuthTokenRepository.revoke_tokens_for_users": lambda: UserAuthTokenRepository.revoke_tokens_for_users(
+            user_ids
+        ),
+        "TeamsRepository.get_by_id": lambda: TeamsRepository.get_by_id(team.id),
+        "TeamsRepository.can_manage_users": lambda: TeamsRepository.can_manage_users(team.id, user.id),
+        "TeamsRepository.get_existing_user_ids": lambda: TeamsRepository.get_existing_user_ids(user_ids),
+        "TeamsRepository.get_roles": lambda: TeamsRepository.get_roles(user_ids, [team.id]),
+        "TeamsRepository.bulk_upsert_members": lambda: TeamsRepository.bulk_upsert_members(
+            team.id,
+            [UserTeam(user_id=user_id, team_id=team.id) for user_id in user_ids],
+            [Role(user_id=user_id, team_id=team.id, role="pm") for user_id in user_ids],
+            {("has_permission_manage_users", True): user_ids[:1]},
+        ),
+        "TeammatesRepository.add_members": lambda: TeammatesRepository.add_members(team.id, user_ids),
+        "TeammatesRepository.remove_member": lambda: TeammatesRepository.remove_member(team.id, user_ids[-1]),
+        "TeammatesRepository.rebuild_team": lambda: TeammatesRepository.rebuild_team(team.id),
+        "TeammatesRepository.get_teammates_page": lambda: TeammatesRepository.get_teammates_page(
+            user.id, after=user.id
+        ),
+        "JobsRepository.create": lambda: JobsRepository.create(Job(kind="seed", run_after=timezone.now())),
+        "JobsRepository.get_by_id": lambda: JobsRepository.get_by_id(job.id),
+        "JobsRepository.has_unfinished": lambda: JobsRepository.has_unfinished("seed"),
+        "JobsRepository.claim": lambda: JobsRepository.claim("query-plans", 5, since),
+        "JobsRepository.renew_lease": lambda: JobsRepository.renew_lease(job.id, "query-plans", 1),
+        "JobsRepository.update_progress": lambda: JobsRepository.update_progress(
+            job.id, "query-plans", 1, 1, 2, "half"
+        ),
+        "JobsRepository.reschedule": lambda: JobsRepository.reschedule(
+            job.id, "query-plans", 1, timezone.now(), "error"
+        ),
+        "JobsRepository.mark_failed": lambda: JobsRepository.mark_failed(job.id, "query-plans", 1, "error"),
+        "JobsRepository.mark_succeeded": lambda: JobsRepository.mark_succeeded(job.id, "query-plans", 1, {}),
+        "AnalyticsRepository.get_state": AnalyticsRepository.get_state,
+        "AnalyticsRepository.lock_state": lock_state,
+        # Saves the row lock_state created
+        "AnalyticsRepository.save_state": lambda: AnalyticsRepository.save_state(AnalyticsRepository.get_state()),
+        "AnalyticsRepository.get_all_user_ids": AnalyticsRepository.get_all_user_ids,
+        "AnalyticsRepository.get_changed_user_ids": lambda: AnalyticsRepository.get_changed_user_ids(since),
+        "AnalyticsRepository.mark_pending": lambda: AnalyticsRepository.mark_pending(user_ids),
+        "AnalyticsRepository.get_pending_user_ids": AnalyticsRepository.get_pending_user_ids,
+        "AnalyticsRepository.clear_pending": lambda: AnalyticsRepository.clear_pending(user_ids, timezone.now()),
+        "AnalyticsRepository.compute_facts": lambda: AnalyticsRepository.compute_facts(user_ids),
+        "AnalyticsRepository.get_facts": lambda: AnalyticsRepository.get_facts(user_ids),
+        "AnalyticsRepository.replace_facts": lambda: AnalyticsRepository.replace_facts(
+            {(user.id, "city", "almaty")}, {(user.id, "faculty", user.faculty)}
+        ),
+        "AnalyticsRepository.apply_deltas": lambda: AnalyticsRepository.apply_deltas(
+            {("city", "almaty"): 1, ("faculty", user.faculty): -1}
+        ),
+        "AnalyticsRepository.get_counts": lambda: AnalyticsRepository.get_counts("faculty"),
+        "AnalyticsRepository.get_fact_pairs": lambda: AnalyticsRepository.get_fact_pairs(["faculty", "role"]),
+    }
+
+
+def _explain(sql: str) -> List[str]:
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return [row[-1] for row in cursor.fetchall()]
+        cursor.execute(f"EXPLAIN (COSTS OFF) {sql}")
+        return [row[0] for row in cursor.fetchall()]
+
+
+def normalize(lines: List[str]) -> List[str]:
+    normalized = []
+    for line in lines:
+        line = _PG_COSTS.sub("", line)
+        line = _NUMBERS.sub("N", line).strip()
+        if line:
+            normalized.append(line)
+    return normalized
+
+
+def capture_plans(probe: dict) -> Dict[str, List[List[str]]]:
+    plans = {}
+    # Keep the team catalog from re-checking its stamp mid-run so every
+    # method issues the same statements on each capture
+    check_interval, team_catalog.check_interval = team_catalog.check_interval, float("inf")
+    try:
+        for name, run in repository_queries(probe).items():
+            with CaptureQueriesContext(connection) as captured:
+                run()
+            plans[name] = [
+                normalize(_explain(query["sql"]))
+                for query in captured.captured_queries
+                if query["sql"].lstrip().upper().startswith(_EXPLAINABLE)
+            ]
+    finally:
+        team_catalog.check_interval = check_interval
+    return plans
+
+
+def is_full_scan(line: str) -> bool:
+    if connection.vendor == "sqlite":
+        return line.startswith("SCAN ") and " USING " not in line
+    return "Seq Scan" in line
+
+
+def uses_temp_btree(line: str) -> bool:
+    if connection.vendor == "sqlite":
+        return "USE TEMP B-TREE" in line
+    return line.lstrip("-> ").startswith("Sort")
+
+
+def find_regressions(baseline: List[List[str]], current: List[List[str]]) -> List[str]:
+    problems = []
+    if len(baseline) != len(current):
+        problems.append(f"statement count changed from {len(baseline)} to {len(current)}")
+    for index, (old, new) in enumerate(zip(baseline, current)):
+        if any(is_full_scan(line) for line in new) and not any(is_full_scan(line) for line in old):
+            problems.append(f"statement {index} switched to a full scan: {new}")
+        if any(uses_temp_btree(line) for line in new) and not any(uses_temp_btree(line) for line in old):
+            problems.append(f"statement {index} now builds a temp B-tree: {new}")
+    return problems
+
+
+def load_baselines() -> Dict[str, Dict[str, List[List[str]]]]:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def write_baselines(plans: Dict[str, List[List[str]]]) -> None:
+    baselines = load_baselines()
+    baselines[connection.vendor] = plans
+    BASELINE_FILE.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,75 @@
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import List
+
+from django.conf import settings
+
+# Runs in a fresh interpreter so nothing is already imported or configured
+_PROBE = """
+import json, os, resource, sys, time
+started = time.perf_counter()
+from hrtech.conf import ENV_ID
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", f"hrtech.env.{ENV_ID}")
+import django
+django.setup()
+ready = time.perf_counter()
+from django.test import Client
+Client(SERVER_NAME="localhost").get(sys.argv[1])
+served = time.perf_counter()
+json.dump({
+    "setup_seconds": ready - started,
+    "first_request_seconds": served - started,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}, sys.stdout)
+"""
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupReport:
+    setup_seconds: float
+    first_request_seconds: float
+    max_rss_kb: int
+    imports: List[ImportRecord] = field(default_factory=list)
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        stripped = name.lstrip()
+        records.append(ImportRecord(
+            module=stripped,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=(len(name) - len(stripped) - 1) // 2,
+        ))
+    return records
+
+
+def measure_cold_start(path: str = None) -> StartupReport:
+    path = path or settings.STARTUP_PROBE_PATH
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, path],
+        cwd=settings.BASE_DIR,
+        env={key: value for key, value in os.environ.items() if key != "DJANGO_SETTINGS_MODULE"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # stdout carries only the JSON document; request logging goes to stderr
+    report = StartupReport(**json.loads(completed.stdout))
+    report.imports = parse_importtime(completed.stderr)
+    return report
@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class ModulesTestRunner(DiscoverRunner):
+    """
+    Tests live in ``modules/<app>/tests/*_tests.py``. Without labels every
+    app under ``modules`` is tested; ``modules`` itself is not a package,
+    so discovery is anchored at BASE_DIR.
+    """
+
+    def __init__(self, pattern="*_tests.py", top_level=None, **kwargs):
+        super().__init__(pattern=pattern, top_level=top_level or str(settings.BASE_DIR), **kwargs)
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.set_defaults(pattern="*_tests.py")
+
+    def build_suite(self, test_labels=None, *args, **kwargs):
+        if not test_labels:
+            test_labels = [app for app in settings.INSTALLED_APPS if app.startswith("modules.")]
+        return super().build_suite(test_labels, *args, **kwargs)
+
+    def teardown_databases(self, old_config, **kwargs):
+        # Pending token touches point at the test database that is about to go
+        from modules.users.services.token_activity_service import token_activity
+
+        token_activity.reset()
+        super().teardown_databases(old_config, **kwargs)
@@ -20,4 +20,7 @@ from django.urls import include, path
 urlpatterns = [
     path('admin/', admin.site.urls),
     path("v1/users/", include("modules.users.urls")),
+    path("v1/teams/", include("modules.teams.urls")),
+    path("v1/jobs/", include("modules.jobs.urls")),
+    path("v1/analytics/", include("modules.analytics.urls")),
 ]
@@ -0,0 +1,29 @@
+from rest_framework.viewsets import ViewSet
+from rest_framework.response import Response
+from rest_framework import permissions
+
+from modules.analytics.serializers.analytics_serializers import MemberCountsQuerySerializer, PivotQuerySerializer
+from modules.analytics.services.analytics_service import AnalyticsService
+from modules.users.permissions import staff_token_error
+
+
+class AnalyticsController(ViewSet):
+    permission_classes = [permissions.AllowAny]
+
+    def members(self, request):
+        error = staff_token_error(request)
+        if error:
+            return error
+
+        query = MemberCountsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(AnalyticsService.get_member_counts(query.validated_data["dimension"]))
+
+    def pivot(self, request):
+        error = staff_token_error(request)
+        if error:
+            return error
+
+        query = PivotQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(AnalyticsService.pivot(**query.validated_data))
@@ -0,0 +1,2 @@
+class UnknownDimensionError(Exception):
+    pass
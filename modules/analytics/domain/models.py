@@ -0,0 +1,94 @@
+from django.db import models
+
+
+ANALYTICS_DIMENSIONS = (
+    "role",
+    "faculty",
+    "city",
+    "admission_year",
+    "educational_institution_type",
+)
+
+
+class MemberFact(models.Model):
+    """
+    Compact directory snapshot: one row per (active member, dimension, value).
+    Multi-valued dimensions such as role have several rows per member.
+    """
+
+    # Facts of deleted users are left for the next refresh to diff away, so
+    # their counts are decremented; a cascade would lose them silently
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.DO_NOTHING,
+        related_name="+",
+        db_index=False,
+        db_constraint=False,
+    )
+    dimension = models.CharField(max_length=32)
+    value = models.CharField(max_length=255)
+
+    class Meta:
+        app_label = "analytics"
+        db_table = "analytics_member_facts"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "dimension", "value"], name="unique_member_fact"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["dimension", "value"], name="analytics_fact_dim_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.dimension}={self.value}"
+
+
+class MemberCount(models.Model):
+    """Number of active members per (dimension, value), maintained from MemberFact deltas."""
+
+    dimension = models.CharField(max_length=32)
+    value = models.CharField(max_length=255)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        app_label = "analytics"
+        db_table = "analytics_member_counts"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dimension", "value"], name="unique_member_count"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}={self.value}: {self.count}"
+
+
+class PendingMember(models.Model):
+    """
+    Users whose facts must be recomputed although none of their rows has a
+    newer updated_at: the user, a role or a membership was hard-deleted.
+    Written by post_delete receivers, consumed by the next refresh.
+    """
+
+    user_id = models.UUIDField(primary_key=True)
+    marked_at = models.DateTimeField()
+
+    class Meta:
+        app_label = "analytics"
+        db_table = "analytics_pending_members"
+
+    def __str__(self):
+        return f"{self.user_id} ({self.marked_at})"
+
+
+class AnalyticsState(models.Model):
+    """Single row holding the updated_at watermark of the last refresh."""
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=1)
+    watermark = models.DateTimeField(null=True, blank=True)
+    refreshed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        app_label = "analytics"
+        db_table = "analytics_state"
@@ -0,0 +1,9 @@
+from modules.jobs.registry import register_job
+
+
+@register_job("analytics.refresh")
+def refresh(context):
+    # Imported here so registering the handler at startup does not load numpy
+    from modules.analytics.services.analytics_service import AnalyticsService
+
+    return AnalyticsService.refresh()
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.20 on 2026-10-19 11:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('users', '0004_user_birthday_key_cohort_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsState',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, primary_key=True, serialize=False)),
+                ('watermark', models.DateTimeField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'analytics_state',
+            },
+        ),
+        migrations.CreateModel(
+            name='MemberCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=32)),
+                ('value', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'analytics_member_counts',
+            },
+        ),
+        migrations.CreateModel(
+            name='MemberFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=32)),
+                ('value', models.CharField(max_length=255)),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='users.user')),
+            ],
+            options={
+                'db_table': 'analytics_member_facts',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='membercount',
+            constraint=models.UniqueConstraint(fields=('dimension', 'value'), name='unique_member_count'),
+        ),
+        migrations.AddIndex(
+            model_name='memberfact',
+            index=models.Index(fields=['dimension', 'value'], name='analytics_fact_dim_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='memberfact',
+            constraint=models.UniqueConstraint(fields=('user', 'dimension', 'value'), name='unique_member_fact'),
+        ),
+    ]
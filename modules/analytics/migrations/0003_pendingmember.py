@@ -0,0 +1,39 @@
+# Generated by Django 4.2.20 on 2026-10-19 12:41
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def mark_orphaned_facts(apps, schema_editor):
+    # Users hard-deleted before deletes were recorded still have facts
+    MemberFact = apps.get_model('analytics', 'MemberFact')
+    PendingMember = apps.get_model('analytics', 'PendingMember')
+    User = apps.get_model('users', 'User')
+    orphaned = MemberFact.objects.exclude(user_id__in=User.objects.values('id')).values_list('user_id', flat=True).distinct()
+    now = timezone.now()
+    PendingMember.objects.bulk_create(
+        [PendingMember(user_id=user_id, marked_at=now) for user_id in orphaned],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_userauthtoken_supersede_by_newest'),
+        ('analytics', '0002_memberfact_user_no_cascade'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingMember',
+            fields=[
+                ('user_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('marked_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'analytics_pending_members',
+            },
+        ),
+        migrations.RunPython(mark_orphaned_facts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1 @@
+from modules.analytics.domain.models import *  # noqa: F401,F403
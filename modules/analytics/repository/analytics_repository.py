@@ -0,0 +1,126 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from django.db.models import F
+from django.utils import timezone
+from modules.analytics.domain.models import AnalyticsState, MemberCount, MemberFact, PendingMember
+from modules.teams.domain.models import Role, Team, UserTeam
+from modules.users.domain.models import User
+
+Fact = Tuple[object, str, str]
+
+
+class AnalyticsRepository:
+
+    @staticmethod
+    def get_state() -> Optional[AnalyticsState]:
+        return AnalyticsState.objects.filter(id=1).first()
+
+    @staticmethod
+    def lock_state() -> AnalyticsState:
+        """Must run inside a transaction; serializes concurrent refreshes."""
+        AnalyticsState.objects.get_or_create(id=1)
+        return AnalyticsState.objects.select_for_update().get(id=1)
+
+    @staticmethod
+    def save_state(state: AnalyticsState) -> None:
+        state.save()
+
+    @staticmethod
+    def get_all_user_ids() -> Set:
+        return set(User.objects.values_list("id", flat=True))
+
+    @staticmethod
+    def get_changed_user_ids(since: datetime) -> Set:
+        changed_teams = Team.objects.filter(updated_at__gt=since).values("id")
+        user_ids = set(User.objects.filter(updated_at__gt=since).values_list("id", flat=True))
+        user_ids.update(Role.objects.filter(updated_at__gt=since).values_list("user_id", flat=True))
+        user_ids.update(UserTeam.objects.filter(updated_at__gt=since).values_list("user_id", flat=True))
+        user_ids.update(UserTeam.objects.filter(team_id__in=changed_teams).values_list("user_id", flat=True))
+        return user_ids
+
+    @staticmethod
+    def mark_pending(user_ids: Iterable) -> None:
+        now = timezone.now()
+        # A user marked again moves forward, so a refresh already under way keeps the row
+        PendingMember.objects.bulk_create(
+            [PendingMember(user_id=user_id, marked_at=now) for user_id in user_ids],
+            update_conflicts=True,
+            unique_fields=["user_id"],
+            update_fields=["marked_at"],
+        )
+
+    @staticmethod
+    def get_pending_user_ids() -> Set:
+        return set(PendingMember.objects.values_list("user_id", flat=True))
+
+    @staticmethod
+    def clear_pending(user_ids: Iterable, marked_before: datetime) -> None:
+        PendingMember.objects.filter(user_id__in=list(user_ids), marked_at__lt=marked_before).delete()
+
+    @staticmethod
+    def compute_facts(user_ids: Iterable) -> Set[Fact]:
+        facts = set()
+        members = User.objects.filter(id__in=list(user_ids), deleted_at__isnull=True, is_active=True)
+        active_ids = []
+        for user_id, faculty, city, admission_year in members.values_list("id", "faculty", "city", "admission_year"):
+            active_ids.append(user_id)
+            for dimension, value in (("faculty", faculty), ("city", city), ("admission_year", admission_year)):
+                if value not in (None, ""):
+                    facts.add((user_id, dimension, str(value)))
+
+        roles = Role.objects.filter(user_id__in=active_ids, deleted_at__isnull=True)
+        for user_id, role in roles.values_list("user_id", "role"):
+            facts.add((user_id, "role", role))
+
+        memberships = UserTeam.objects.filter(
+            user_id__in=active_ids, deleted_at__isnull=True, team__deleted_at__isnull=True
+        )
+        for user_id, institution_type in memberships.values_list("user_id", "team__educational_institution_type"):
+            if institution_type:
+                facts.add((user_id, "educational_institution_type", institution_type))
+        return facts
+
+    @staticmethod
+    def get_facts(user_ids: Iterable) -> Set[Fact]:
+        return set(
+            MemberFact.objects.filter(user_id__in=list(user_ids)).values_list("user_id", "dimension", "value")
+        )
+
+    @staticmethod
+    def replace_facts(added: Set[Fact], removed: Set[Fact]) -> None:
+        removed_by_key = defaultdict(list)
+        for user_id, dimension, value in removed:
+            removed_by_key[(dimension, value)].append(user_id)
+        for (dimension, value), user_ids in removed_by_key.items():
+            MemberFact.objects.filter(dimension=dimension, value=value, user_id__in=user_ids).delete()
+        MemberFact.objects.bulk_create(
+            [MemberFact(user_id=user_id, dimension=dimension, value=value) for user_id, dimension, value in added],
+            batch_size=1000,
+        )
+
+    @staticmethod
+    def apply_deltas(deltas: Dict[Tuple[str, str], int]) -> None:
+        MemberCount.objects.bulk_create(
+            [MemberCount(dimension=dimension, value=value) for dimension, value in deltas],
+            ignore_conflicts=True,
+        )
+        by_delta = defaultdict(list)
+        for key, delta in deltas.items():
+            if delta:
+                by_delta[delta].append(key)
+        # One UPDATE per distinct (delta, dimension) rather than per value
+        for delta, keys in by_delta.items():
+            for dimension in {dimension for dimension, _ in keys}:
+                values = [value for key_dimension, value in keys if key_dimension == dimension]
+                MemberCount.objects.filter(dimension=dimension, value__in=values).update(count=F("count") + delta)
+
+    @staticmethod
+    def get_counts(dimension: str) -> List[MemberCount]:
+        return list(MemberCount.objects.filter(dimension=dimension, count__gt=0).order_by("-count", "value"))
+
+    @staticmethod
+    def get_fact_pairs(dimensions: Iterable[str]) -> List[Tuple[object, str, str]]:
+        return list(
+            MemberFact.objects.filter(dimension__in=list(dimensions)).values_list("user_id", "dimension", "value")
+        )
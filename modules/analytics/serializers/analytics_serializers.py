@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from modules.analytics.domain.models import ANALYTICS_DIMENSIONS
+
+
+class MemberCountsQuerySerializer(serializers.Serializer):
+    dimension = serializers.ChoiceField(choices=ANALYTICS_DIMENSIONS)
+
+
+class PivotQuerySerializer(serializers.Serializer):
+    rows = serializers.ChoiceField(choices=ANALYTICS_DIMENSIONS)
+    columns = serializers.ChoiceField(choices=ANALYTICS_DIMENSIONS)
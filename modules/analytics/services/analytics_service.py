@@ -0,0 +1,175 @@
+import threading
+from collections import Counter
+from datetime import timedelta
+from typing import List
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from modules.analytics.domain.exceptions import UnknownDimensionError
+from modules.analytics.domain.models import ANALYTICS_DIMENSIONS, MemberCount
+from modules.analytics.repository.analytics_repository import AnalyticsRepository
+from modules.jobs.services.jobs_service import JobService
+
+CHUNK_SIZE = 500
+
+_snapshot_lock = threading.Lock()
+_snapshot = {"refreshed_at": None, "dimensions": {}}
+# Interval bucket this process already scheduled (or found) a refresh for
+_scheduled = {"bucket": None}
+
+
+def _option(name: str, default):
+    return getattr(settings, "ANALYTICS", {}).get(name, default)
+
+
+def _validate(dimension: str) -> None:
+    if dimension not in ANALYTICS_DIMENSIONS:
+        raise UnknownDimensionError(f"Unknown dimension {dimension!r}, expected one of {ANALYTICS_DIMENSIONS}")
+
+
+class AnalyticsService:
+
+    @staticmethod
+    def refresh() -> dict:
+        """
+        Recompute facts for users whose rows (or roles, memberships, teams)
+        changed since the last watermark, and for users marked pending by a
+        hard delete, and apply the differences to the member counts.
+        The first run covers every user.
+
+        Each chunk commits on its own, so writers wait for one chunk at most.
+        The watermark only moves once every chunk is applied; a refresh that
+        stops halfway is redone from the old watermark, which is safe because
+        chunks are diffed against the stored facts.
+        """
+        started = timezone.now()
+        added_total = removed_total = 0
+        state = AnalyticsRepository.get_state()
+        if state is None or state.watermark is None:
+            user_ids = AnalyticsRepository.get_all_user_ids()
+        else:
+            # Overlap covers rows saved before the watermark but committed after it
+            overlap = timedelta(seconds=_option("WATERMARK_OVERLAP_SECONDS", 60))
+            user_ids = AnalyticsRepository.get_changed_user_ids(state.watermark - overlap)
+
+        user_ids = list(user_ids | AnalyticsRepository.get_pending_user_ids())
+        for start in range(0, len(user_ids), CHUNK_SIZE):
+            chunk = user_ids[start:start + CHUNK_SIZE]
+            with transaction.atomic():
+                AnalyticsRepository.lock_state()
+                new_facts = AnalyticsRepository.compute_facts(chunk)
+                old_facts = AnalyticsRepository.get_facts(chunk)
+                added, removed = new_facts - old_facts, old_facts - new_facts
+
+                deltas = Counter()
+                for _, dimension, value in added:
+                    deltas[(dimension, value)] += 1
+                for _, dimension, value in removed:
+                    deltas[(dimension, value)] -= 1
+
+                AnalyticsRepository.replace_facts(added, removed)
+                AnalyticsRepository.apply_deltas(deltas)
+                # Users marked again after the refresh started stay pending
+                AnalyticsRepository.clear_pending(chunk, started)
+            added_total += len(added)
+            removed_total += len(removed)
+
+        with transaction.atomic():
+            state = AnalyticsRepository.lock_state()
+            state.watermark = started
+            state.refreshed_at = timezone.now()
+            AnalyticsRepository.save_state(state)
+
+        return {"users": len(user_ids), "facts_added": added_total, "facts_removed": removed_total}
+
+    @staticmethod
+    def schedule_refresh_if_stale() -> None:
+        state = AnalyticsRepository.get_state()
+        interval = _option("REFRESH_INTERVAL_SECONDS", 300)
+        now = timezone.now()
+        if state and state.refreshed_at and now - state.refreshed_at < timedelta(seconds=interval):
+            return
+        # Reads stay reads: each process checks once per interval bucket and
+        # only inserts when no refresh is queued or running already
+        bucket = int(now.timestamp()) // interval
+        if _scheduled["bucket"] == bucket:
+            return
+        if not JobService.has_unfinished("analytics.refresh"):
+            JobService.enqueue("analytics.refresh", idempotency_key=f"analytics.refresh:{bucket}")
+        _scheduled["bucket"] = bucket
+
+    @staticmethod
+    def get_member_counts(dimension: str) -> dict:
+        _validate(dimension)
+        AnalyticsService.schedule_refresh_if_stale()
+        state = AnalyticsRepository.get_state()
+        counts: List[MemberCount] = AnalyticsRepository.get_counts(dimension)
+        return {
+            "dimension": dimension,
+            "counts": [{"value": row.value, "count": row.count} for row in counts],
+            "refreshed_at": state.refreshed_at if state else None,
+        }
+
+    @staticmethod
+    def pivot(rows: str, columns: str) -> dict:
+        """Members per (rows value, columns value) computed in memory from the fact snapshot."""
+        import numpy as np
+
+        _validate(rows)
+        _validate(columns)
+        AnalyticsService.schedule_refresh_if_stale()
+        dimensions = AnalyticsService._load_snapshot()
+        row_users, row_codes, row_values = dimensions[rows]
+        column_users, column_codes, column_values = dimensions[columns]
+
+        n_rows, n_columns = len(row_values), len(column_values)
+        n_users = int(max(row_users.max(initial=-1), column_users.max(initial=-1))) + 1
+
+        # Pair every row fact with every column fact of the same user
+        order = np.argsort(column_users, kind="stable")
+        column_users, column_codes = column_users[order], column_codes[order]
+        per_user = np.bincount(column_users, minlength=n_users)
+        first = np.cumsum(per_user) - per_user
+        repeats = per_user[row_users]
+        offsets = np.arange(repeats.sum()) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        paired_columns = column_codes[np.repeat(first[row_users], repeats) + offsets]
+        paired_rows = np.repeat(row_codes, repeats)
+
+        cells = np.bincount(paired_rows * n_columns + paired_columns, minlength=n_rows * n_columns)
+        return {
+            "rows": row_values,
+            "columns": column_values,
+            "counts": cells.reshape(n_rows, n_columns).tolist(),
+            "refreshed_at": _snapshot["refreshed_at"],
+        }
+
+    @staticmethod
+    def _load_snapshot() -> dict:
+        import numpy as np
+
+        state = AnalyticsRepository.get_state()
+        refreshed_at = state.refreshed_at if state else None
+        with _snapshot_lock:
+            if _snapshot["dimensions"] and _snapshot["refreshed_at"] == refreshed_at:
+                return _snapshot["dimensions"]
+
+            user_index = {}
+            raw = {dimension: ([], []) for dimension in ANALYTICS_DIMENSIONS}
+            for user_id, dimension, value in AnalyticsRepository.get_fact_pairs(ANALYTICS_DIMENSIONS):
+                users, values = raw[dimension]
+                users.append(user_index.setdefault(user_id, len(user_index)))
+                values.append(value)
+
+            dimensions = {}
+            for dimension, (users, values) in raw.items():
+                labels, codes = np.unique(np.array(values, dtype=object), return_inverse=True)
+                dimensions[dimension] = (
+                    np.array(users, dtype=np.int64),
+                    codes.astype(np.int64),
+                    [str(label) for label in labels],
+                )
+            _snapshot["dimensions"] = dimensions
+            _snapshot["refreshed_at"] = refreshed_at
+            return dimensions
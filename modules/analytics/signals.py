@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from modules.analytics.repository.analytics_repository import AnalyticsRepository
+from modules.teams.domain.models import Role, UserTeam
+from modules.users.domain.models import User
+
+
+@receiver(post_delete, sender=User)
+def mark_deleted_user(sender, instance, **kwargs):
+    AnalyticsRepository.mark_pending([instance.id])
+
+
+@receiver(post_delete, sender=Role)
+@receiver(post_delete, sender=UserTeam)
+def mark_user_of_deleted_row(sender, instance, **kwargs):
+    # A hard-deleted row leaves no updated_at behind for the next
+    # incremental refresh to find
+    AnalyticsRepository.mark_pending([instance.user_id])
@@ -0,0 +1,174 @@
+import uuid
+from collections import Counter
+from itertools import product
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from modules.analytics.domain.models import AnalyticsState, MemberCount, MemberFact, PendingMember
+from modules.analytics.repository.analytics_repository import AnalyticsRepository
+from modules.analytics.services import analytics_service
+from modules.analytics.services.analytics_service import AnalyticsService
+from modules.jobs.domain.models import Job
+from modules.teams.domain.models import Role, Team, UserTeam
+from modules.users.domain.models import User, UserAuthToken
+
+
+class AnalyticsRefreshTest(TestCase):
+
+    def setUp(self):
+        self.university = Team.objects.create(name="U", educational_institution_type="university", city_id=uuid.uuid4())
+        self.school = Team.objects.create(name="S", educational_institution_type="school", city_id=uuid.uuid4())
+        self.users = []
+        for i in range(6):
+            user = User.objects.create(
+                email=f"user{i}@example.com",
+                first_name="User",
+                last_name=str(i),
+                faculty=["cs", "math"][i % 2],
+                city=["almaty", "astana", ""][i % 3],
+                admission_year=2020 + i % 2,
+            )
+            team = self.university if i < 4 else self.school
+            UserTeam.objects.create(user=user, team=team)
+            Role.objects.create(user=user, team=team, role=["developer", "designer", "pm"][i % 3])
+            self.users.append(user)
+
+    def _assert_matches_full_recompute(self):
+        expected_facts = AnalyticsRepository.compute_facts(User.objects.values_list("id", flat=True))
+        stored_facts = set(MemberFact.objects.values_list("user_id", "dimension", "value"))
+        self.assertEqual(stored_facts, expected_facts)
+
+        expected_counts = Counter((dimension, value) for _, dimension, value in expected_facts)
+        stored_counts = {(row.dimension, row.value): row.count for row in MemberCount.objects.exclude(count=0)}
+        self.assertEqual(stored_counts, dict(expected_counts))
+        self.assertFalse(MemberCount.objects.filter(count__lt=0).exists())
+
+    def test_incremental_refresh_matches_full_recompute(self):
+        AnalyticsService.refresh()
+        self._assert_matches_full_recompute()
+
+        user = self.users[0]
+        user.faculty = "physics"
+        user.save()
+        role = Role.objects.get(user=self.users[1])
+        role.deleted_at = timezone.now()
+        role.save()
+        Role.objects.filter(user=self.users[2]).delete()
+        UserTeam.objects.filter(user=self.users[3]).delete()
+        self.users[4].delete()
+        User.objects.filter(id=self.users[5].id).update(is_active=False, updated_at=timezone.now())
+        self.university.educational_institution_type = "college"
+        self.university.save()
+        User.objects.create(email="new@example.com", first_name="New", last_name="User", faculty="cs")
+
+        result = AnalyticsService.refresh()
+
+        self.assertGreater(result["facts_removed"], 0)
+        self._assert_matches_full_recompute()
+        self.assertFalse(MemberFact.objects.filter(user_id=self.users[4].id).exists())
+
+    def test_hard_deletes_are_recorded_without_touching_users(self):
+        AnalyticsService.refresh()
+        user, deleted = self.users[2], self.users[4]
+        deleted_id = deleted.id
+        updated_at = User.objects.get(id=user.id).updated_at
+
+        Role.objects.filter(user=user).delete()
+        deleted.delete()
+
+        self.assertEqual(User.objects.get(id=user.id).updated_at, updated_at)
+        self.assertEqual(set(PendingMember.objects.values_list("user_id", flat=True)), {user.id, deleted_id})
+
+        AnalyticsService.refresh()
+
+        self.assertFalse(PendingMember.objects.exists())
+        self._assert_matches_full_recompute()
+
+    def test_refresh_commits_in_chunks(self):
+        analytics_service.CHUNK_SIZE = 2
+        self.addCleanup(setattr, analytics_service, "CHUNK_SIZE", 500)
+        AnalyticsState.objects.create(id=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            AnalyticsService.refresh()
+
+        # One transaction per chunk of the 6 users, then one for the watermark;
+        # savepoints here, as TestCase wraps each test in a transaction
+        savepoints = [query["sql"] for query in queries if query["sql"].startswith("SAVEPOINT")]
+        self.assertEqual(len(savepoints), 3 + 1)
+        self._assert_matches_full_recompute()
+
+    def test_refresh_without_changes_is_a_no_op(self):
+        AnalyticsService.refresh()
+
+        result = AnalyticsService.refresh()
+
+        self.assertEqual((result["facts_added"], result["facts_removed"]), (0, 0))
+        self._assert_matches_full_recompute()
+
+    def test_pivot_matches_facts(self):
+        AnalyticsService.refresh()
+        facts = set(MemberFact.objects.values_list("user_id", "dimension", "value"))
+
+        for rows, columns in [("role", "faculty"), ("faculty", "faculty"), ("city", "educational_institution_type")]:
+            with self.subTest(rows=rows, columns=columns):
+                pivot = AnalyticsService.pivot(rows, columns)
+                expected = Counter(
+                    (row_value, column_value)
+                    for (user_a, dim_a, row_value), (user_b, dim_b, column_value) in product(facts, facts)
+                    if user_a == user_b and dim_a == rows and dim_b == columns
+                )
+                cells = {
+                    (row_value, column_value): pivot["counts"][i][j]
+                    for i, row_value in enumerate(pivot["rows"])
+                    for j, column_value in enumerate(pivot["columns"])
+                    if pivot["counts"][i][j]
+                }
+                self.assertEqual(cells, dict(expected))
+
+
+class AnalyticsScheduleTest(TestCase):
+
+    def setUp(self):
+        analytics_service._scheduled["bucket"] = None
+        self.addCleanup(analytics_service._scheduled.update, bucket=None)
+
+    def _queries(self, call):
+        with CaptureQueriesContext(connection) as queries:
+            call()
+        return [query["sql"] for query in queries]
+
+    def _inserts(self, call):
+        return [sql for sql in self._queries(call) if sql.startswith("INSERT")]
+
+    def test_stale_reads_enqueue_one_refresh(self):
+        self.assertEqual(len(self._inserts(lambda: AnalyticsService.get_member_counts("role"))), 1)
+
+        # The same bucket is not looked up again by this process
+        queries = self._queries(lambda: AnalyticsService.get_member_counts("role"))
+        self.assertEqual([sql for sql in queries if '"jobs"' in sql], [])
+        self.assertEqual(Job.objects.filter(kind="analytics.refresh").count(), 1)
+
+    def test_pending_refresh_is_not_enqueued_again(self):
+        AnalyticsService.schedule_refresh_if_stale()
+        analytics_service._scheduled["bucket"] = None
+
+        self.assertEqual(self._inserts(AnalyticsService.schedule_refresh_if_stale), [])
+
+    def test_fresh_snapshot_schedules_nothing(self):
+        AnalyticsState.objects.create(id=1, watermark=timezone.now(), refreshed_at=timezone.now())
+
+        self.assertEqual(self._inserts(lambda: AnalyticsService.pivot("role", "faculty")), [])
+        self.assertFalse(Job.objects.exists())
+
+    def test_endpoints_require_staff(self):
+        member = User.objects.create(email="member@example.com", first_name="Member", last_name="Test")
+        UserAuthToken.objects.create(user=member, token="member-token")
+
+        for url, params in [("/v1/analytics/members", {"dimension": "role"}), ("/v1/analytics/members/pivot", {"rows": "role", "columns": "city"})]:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url, params).status_code, 401)
+                self.assertEqual(self.client.get(url, params, HTTP_AUTHORIZATION="Bearer member-token").status_code, 403)
@@ -0,0 +1,9 @@
+from django.urls import path
+from modules.analytics.controllers.analytics_controller import AnalyticsController
+
+analytics = AnalyticsController.as_view
+
+urlpatterns = [
+    path("members", analytics({"get": "members"})),
+    path("members/pivot", analytics({"get": "pivot"})),
+]
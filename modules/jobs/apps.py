@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "modules.jobs"
+
+    def ready(self):
+        # Job handlers live in each module's jobs.py
+        autodiscover_modules("jobs")
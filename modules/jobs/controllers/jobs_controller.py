@@ -0,0 +1,36 @@
+from rest_framework.viewsets import ViewSet
+from rest_framework.response import Response
+from rest_framework import status, permissions
+
+from modules.jobs.domain.exceptions import JobNotFoundError, UnknownJobKindError
+from modules.jobs.serializers.jobs_serializers import EnqueueJobSerializer, JobSerializer
+from modules.jobs.services.jobs_service import JobService
+from modules.users.permissions import staff_token_error
+
+
+class JobsController(ViewSet):
+    permission_classes = [permissions.AllowAny]
+
+    def create(self, request):
+        error = staff_token_error(request)
+        if error:
+            return error
+
+        serializer = EnqueueJobSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            job = JobService.enqueue(**serializer.validated_data)
+        except UnknownJobKindError:
+            return Response({"detail": "Unknown job kind"}, status=400)
+        return Response({"job": JobSerializer(job).data}, status=status.HTTP_202_ACCEPTED)
+
+    def retrieve(self, request, pk=None):
+        error = staff_token_error(request)
+        if error:
+            return error
+
+        try:
+            job = JobService.get_job(pk)
+        except JobNotFoundError:
+            return Response({"detail": "Job not found"}, status=404)
+        return Response({"job": JobSerializer(job).data})
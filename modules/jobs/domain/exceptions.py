@@ -0,0 +1,6 @@
+class JobNotFoundError(Exception):
+    pass
+
+
+class UnknownJobKindError(Exception):
+    pass
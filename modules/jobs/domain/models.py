@@ -0,0 +1,41 @@
+import uuid
+from django.db import models
+
+
+JOB_STATUS_CHOICES = (
+    ("queued", "queued"),
+    ("running", "running"),
+    ("succeeded", "succeeded"),
+    ("failed", "failed"),
+)
+
+
+class Job(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=255)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=32, choices=JOB_STATUS_CHOICES, default="queued")
+    idempotency_key = models.CharField(max_length=255, null=True, blank=True, unique=True)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField()
+    locked_by = models.CharField(max_length=255, null=True, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(null=True, blank=True)
+    progress_message = models.CharField(max_length=255, blank=True, default="")
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        app_label = "jobs"
+        db_table = "jobs"
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="jobs_status_run_after_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} - {self.id} ({self.status})"
@@ -0,0 +1,66 @@
+import multiprocessing
+import os
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from modules.jobs.services.jobs_service import JobService
+
+
+def run_job(job_id, worker_id):
+    close_old_connections()
+    try:
+        return JobService.run(job_id, worker_id)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs from the jobs table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="Jobs executed concurrently.")
+        parser.add_argument("--pool", choices=("thread", "process"), default="thread")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to sleep when the queue is empty.")
+        parser.add_argument("--once", action="store_true", help="Exit once no job is ready instead of polling.")
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        if options["pool"] == "process":
+            # Spawned, not forked, so children never share the parent's database connections
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+        in_flight = {}
+        with executor:
+            while True:
+                free = workers - len(in_flight)
+                claimed = JobService.claim(worker_id, free) if free else []
+                for job_id in claimed:
+                    in_flight[executor.submit(run_job, job_id, worker_id)] = job_id
+
+                if not in_flight:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                # With free slots, wake up periodically to claim newly queued jobs
+                timeout = options["poll_interval"] if len(in_flight) < workers else None
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job_id = in_flight.pop(future)
+                    try:
+                        self.stdout.write(f"{job_id}: {future.result()}")
+                    except Exception as exc:
+                        self.stderr.write(f"{job_id}: worker error {exc!r}")
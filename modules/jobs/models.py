@@ -0,0 +1 @@
+from modules.jobs.domain.models import *  # noqa: F401,F403
@@ -0,0 +1,29 @@
+from typing import Callable, Dict
+
+from modules.jobs.domain.exceptions import UnknownJobKindError
+
+_handlers: Dict[str, Callable] = {}
+
+
+def register_job(kind: str):
+    """
+    Register ``handler(context, **payload)`` for jobs of ``kind``. The return
+    value is stored as the job result and must be JSON serializable.
+    """
+
+    def decorator(handler: Callable) -> Callable:
+        _handlers[kind] = handler
+        return handler
+
+    return decorator
+
+
+def get_handler(kind: str) -> Callable:
+    try:
+        return _handlers[kind]
+    except KeyError:
+        raise UnknownJobKindError(f"No handler registered for job kind {kind!r}")
+
+
+def registered_kinds():
+    return sorted(_handlers)
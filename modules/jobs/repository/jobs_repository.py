@@ -0,0 +1,101 @@
+from datetime import datetime
+from typing import List, Optional
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from modules.jobs.domain.models import Job
+
+
+class JobsRepository:
+
+    @staticmethod
+    def create(job: Job) -> Job:
+        """Insert ``job``, or return the existing job with the same idempotency key."""
+        try:
+            with transaction.atomic():
+                job.save(force_insert=True)
+            return job
+        except IntegrityError:
+            if not job.idempotency_key:
+                raise
+            return Job.objects.get(idempotency_key=job.idempotency_key)
+
+    @staticmethod
+    def get_by_id(job_id) -> Optional[Job]:
+        return Job.objects.filter(id=job_id).first()
+
+    @staticmethod
+    def has_unfinished(kind: str) -> bool:
+        return Job.objects.filter(status__in=["queued", "running"], kind=kind).exists()
+
+    @staticmethod
+    def claim(worker_id: str, limit: int, lease_expired_before: datetime) -> List:
+        now = timezone.now()
+        expired = Q(status="running", locked_at__lt=lease_expired_before)
+        # A worker that died on the final attempt leaves nothing to retry
+        Job.objects.filter(expired, attempts__gte=F("max_attempts")).update(
+            status="failed",
+            error="Lease expired on the final attempt",
+            locked_by=None,
+            finished_at=now,
+            updated_at=now,
+        )
+        claimable = Q(status="queued", run_after__lte=now) | (expired & Q(attempts__lt=F("max_attempts")))
+        candidate_ids = list(
+            Job.objects.filter(claimable).order_by("run_after").values_list("id", flat=True)[:limit]
+        )
+        claimed = []
+        for job_id in candidate_ids:
+            # Conditional write: only one worker can move the row out of the claimable state
+            updated = Job.objects.filter(claimable, id=job_id).update(
+                status="running",
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=F("attempts") + 1,
+                updated_at=now,
+            )
+            if updated:
+                claimed.append(job_id)
+        return claimed
+
+    @staticmethod
+    def _leased(job_id, worker_id: str, attempt: int):
+        # Every claim bumps attempts, so a job reclaimed after its lease expired
+        # no longer matches, even when the same worker id claimed it again
+        return Job.objects.filter(id=job_id, status="running", locked_by=worker_id, attempts=attempt)
+
+    @staticmethod
+    def renew_lease(job_id, worker_id: str, attempt: int) -> bool:
+        now = timezone.now()
+        return bool(JobsRepository._leased(job_id, worker_id, attempt).update(locked_at=now, updated_at=now))
+
+    @staticmethod
+    def update_progress(job_id, worker_id: str, attempt: int, done: int, total: Optional[int], message: str) -> bool:
+        now = timezone.now()
+        return bool(JobsRepository._leased(job_id, worker_id, attempt).update(
+            progress_done=done,
+            progress_total=total,
+            progress_message=message[:255],
+            locked_at=now,
+            updated_at=now,
+        ))
+
+    @staticmethod
+    def mark_succeeded(job_id, worker_id: str, attempt: int, result) -> bool:
+        now = timezone.now()
+        return bool(JobsRepository._leased(job_id, worker_id, attempt).update(
+            status="succeeded", result=result, error="", locked_by=None, finished_at=now, updated_at=now
+        ))
+
+    @staticmethod
+    def mark_failed(job_id, worker_id: str, attempt: int, error: str) -> bool:
+        now = timezone.now()
+        return bool(JobsRepository._leased(job_id, worker_id, attempt).update(
+            status="failed", error=error, locked_by=None, finished_at=now, updated_at=now
+        ))
+
+    @staticmethod
+    def reschedule(job_id, worker_id: str, attempt: int, run_after: datetime, error: str) -> bool:
+        return bool(JobsRepository._leased(job_id, worker_id, attempt).update(
+            status="queued", run_after=run_after, error=error, locked_by=None, updated_at=timezone.now()
+        ))
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+
+from modules.jobs.domain.models import Job
+
+
+class EnqueueJobSerializer(serializers.Serializer):
+    kind = serializers.CharField(max_length=255)
+    payload = serializers.DictField(required=False, default=dict)
+    idempotency_key = serializers.CharField(max_length=255, required=False)
+    max_attempts = serializers.IntegerField(min_value=1, max_value=20, required=False)
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = (
+            "id",
+            "kind",
+            "status",
+            "idempotency_key",
+            "attempts",
+            "max_attempts",
+            "run_after",
+            "progress_done",
+            "progress_total",
+            "progress_message",
+            "result",
+            "error",
+            "created_at",
+            "updated_at",
+            "finished_at",
+        )
+        read_only_fields = fields
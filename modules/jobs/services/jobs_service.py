@@ -0,0 +1,129 @@
+import json
+import logging
+import threading
+import traceback
+from datetime import timedelta
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from modules.jobs.domain.exceptions import JobNotFoundError
+from modules.jobs.domain.models import Job
+from modules.jobs.registry import get_handler
+from modules.jobs.repository.jobs_repository import JobsRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _option(name: str, default):
+    return getattr(settings, "JOBS", {}).get(name, default)
+
+
+class JobContext:
+    """Passed to handlers so long jobs can report progress."""
+
+    def __init__(self, job: Job, worker_id: str):
+        self.job = job
+        self.worker_id = worker_id
+
+    def progress(self, done: int, total: Optional[int] = None, message: str = "") -> None:
+        JobsRepository.update_progress(self.job.id, self.worker_id, self.job.attempts, done, total, message)
+
+
+class LeaseHeartbeat:
+    """
+    Renews a claimed job's lease every ``interval`` seconds while its handler
+    runs, so a long job is not reclaimed by another worker. The thread stops
+    once the lease is gone; a failed renewal is logged and retried.
+    """
+
+    def __init__(self, job: Job, worker_id: str, interval: float):
+        self.job = job
+        self.worker_id = worker_id
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"job-heartbeat-{job.id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.wait(self.interval):
+                try:
+                    if not JobsRepository.renew_lease(self.job.id, self.worker_id, self.job.attempts):
+                        return
+                except Exception:
+                    logger.exception("Lease renewal failed for job %s", self.job.id)
+        finally:
+            # Connections are per thread, this one would otherwise stay open
+            connections.close_all()
+
+
+class JobService:
+
+    @staticmethod
+    def enqueue(kind: str, payload: dict = None, idempotency_key: str = None, max_attempts: int = None) -> Job:
+        get_handler(kind)
+        job = Job(
+            kind=kind,
+            payload=payload or {},
+            idempotency_key=idempotency_key or None,
+            max_attempts=max_attempts or _option("MAX_ATTEMPTS", 3),
+            run_after=timezone.now(),
+        )
+        return JobsRepository.create(job)
+
+    @staticmethod
+    def get_job(job_id) -> Job:
+        job = JobsRepository.get_by_id(job_id)
+        if not job:
+            raise JobNotFoundError(f"Job with id={job_id} not found")
+        return job
+
+    @staticmethod
+    def has_unfinished(kind: str) -> bool:
+        """Whether a job of ``kind`` is queued or running."""
+        return JobsRepository.has_unfinished(kind)
+
+    @staticmethod
+    def claim(worker_id: str, limit: int) -> List:
+        lease = timedelta(seconds=_option("LEASE_SECONDS", 300))
+        return JobsRepository.claim(worker_id, limit, timezone.now() - lease)
+
+    @staticmethod
+    def backoff(attempts: int) -> timedelta:
+        seconds = _option("BACKOFF_SECONDS", 10) * 2 ** max(attempts - 1, 0)
+        return timedelta(seconds=min(seconds, _option("MAX_BACKOFF_SECONDS", 600)))
+
+    @staticmethod
+    def run(job_id, worker_id: str) -> str:
+        """
+        Run a job claimed by ``worker_id`` and return its final or rescheduled
+        status, or "lost" when the lease expired and another claim took over.
+        """
+        job = JobService.get_job(job_id)
+        if job.status != "running" or job.locked_by != worker_id:
+            return "lost"
+        heartbeat = _option("HEARTBEAT_SECONDS", _option("LEASE_SECONDS", 300) / 3)
+        try:
+            with LeaseHeartbeat(job, worker_id, heartbeat):
+                result = get_handler(job.kind)(JobContext(job, worker_id), **job.payload)
+            # Encoded before the write, inside the try, so a result that cannot
+            # be stored as JSON fails the attempt instead of the UPDATE
+            json.dumps(result)
+            succeeded = JobsRepository.mark_succeeded(job.id, worker_id, job.attempts, result)
+        except Exception:
+            error = traceback.format_exc()
+            if job.attempts < job.max_attempts:
+                run_after = timezone.now() + JobService.backoff(job.attempts)
+                return "queued" if JobsRepository.reschedule(job.id, worker_id, job.attempts, run_after, error) else "lost"
+            return "failed" if JobsRepository.mark_failed(job.id, worker_id, job.attempts, error) else "lost"
+        return "succeeded" if succeeded else "lost"
@@ -0,0 +1,150 @@
+import io
+import os
+import subprocess
+import sys
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from modules.jobs.domain.models import Job
+from modules.jobs.registry import register_job
+from modules.jobs.repository.jobs_repository import JobsRepository
+from modules.jobs.services.jobs_service import JobService
+
+calls = []
+
+
+@register_job("tests.echo")
+def echo(context, value):
+    calls.append(value)
+    context.progress(1, 1, "done")
+    return {"value": value}
+
+
+@register_job("tests.flaky")
+def flaky(context):
+    raise RuntimeError("boom")
+
+
+@register_job("tests.unserializable")
+def unserializable(context):
+    return {"value": object()}
+
+
+@register_job("tests.slow")
+def slow(context, seconds):
+    time.sleep(seconds)
+    # The lease is long expired unless the heartbeat renewed it
+    calls.append(JobService.claim("other-worker", 1))
+    return {}
+
+
+@override_settings(JOBS={"BACKOFF_SECONDS": 0, "MAX_BACKOFF_SECONDS": 0})
+class JobsTest(TestCase):
+
+    def test_idempotency_key_returns_existing_job(self):
+        first = JobService.enqueue("tests.echo", {"value": 1}, idempotency_key="echo-1")
+        second = JobService.enqueue("tests.echo", {"value": 2}, idempotency_key="echo-1")
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_failing_job_is_retried_then_failed(self):
+        job = JobService.enqueue("tests.flaky", max_attempts=2)
+
+        self.assertEqual(JobService.claim("test", 1), [job.id])
+        self.assertEqual(JobService.run(job.id, "test"), "queued")
+        self.assertEqual(JobService.claim("test", 1), [job.id])
+        self.assertEqual(JobService.run(job.id, "test"), "failed")
+
+        job.refresh_from_db()
+        self.assertEqual(job.attempts, 2)
+        self.assertIn("RuntimeError: boom", job.error)
+        self.assertEqual(JobService.claim("test", 1), [])
+
+    def test_result_that_is_not_json_fails_the_job(self):
+        job = JobService.enqueue("tests.unserializable", max_attempts=1)
+        JobService.claim("test", 1)
+
+        self.assertEqual(JobService.run(job.id, "test"), "failed")
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by), ("failed", None))
+        self.assertIn("TypeError", job.error)
+
+    def _expire_lease(self, job):
+        Job.objects.filter(id=job.id).update(locked_at=timezone.now() - timedelta(hours=1))
+
+    def test_expired_lease_is_reclaimed_until_attempts_run_out(self):
+        job = JobService.enqueue("tests.echo", {"value": 1}, max_attempts=2)
+
+        self.assertEqual(JobService.claim("dead-worker", 1), [job.id])
+        self._expire_lease(job)
+        self.assertEqual(JobService.claim("test", 1), [job.id])
+        self._expire_lease(job)
+        self.assertEqual(JobService.claim("test", 1), [])
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("failed", 2))
+        self.assertIn("Lease expired", job.error)
+
+    def test_worker_that_lost_its_lease_cannot_finish_the_job(self):
+        job = JobService.enqueue("tests.echo", {"value": 1})
+        JobService.claim("slow-worker", 1)
+        self._expire_lease(job)
+        JobService.claim("slow-worker", 1)
+
+        # The first claim's writes no longer match, even from the same worker id
+        job.refresh_from_db()
+        self.assertFalse(JobsRepository.mark_succeeded(job.id, "slow-worker", job.attempts - 1, {}))
+        self.assertFalse(JobsRepository.update_progress(job.id, "slow-worker", job.attempts - 1, 1, 1, ""))
+        self.assertEqual(JobService.run(job.id, "other-worker"), "lost")
+
+        self.assertEqual(JobService.run(job.id, "slow-worker"), "succeeded")
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.result, job.progress_done), ("succeeded", {"value": 1}, 1))
+
+
+class JobHandlerImportsTest(SimpleTestCase):
+
+    def test_setup_does_not_import_handler_services(self):
+        script = (
+            "import sys, django; django.setup(); "
+            "print(sorted(m for m in sys.modules if m.endswith('_service') or m == 'numpy'))"
+        )
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+        output = subprocess.run(
+            [sys.executable, "-c", script], cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "[]")
+
+
+class JobsWorkerTest(TransactionTestCase):
+    # Worker threads use their own connections, so data must be committed
+
+    def setUp(self):
+        calls.clear()
+
+    def test_worker_runs_job_and_reports_progress(self):
+        job = JobService.enqueue("tests.echo", {"value": 42})
+
+        call_command("run_jobs", "--once", "--workers", "2", stdout=io.StringIO())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "succeeded")
+        self.assertEqual(job.result, {"value": 42})
+        self.assertEqual((job.progress_done, job.progress_total, job.progress_message), (1, 1, "done"))
+        self.assertEqual(calls, [42])
+
+    @override_settings(JOBS={"LEASE_SECONDS": 0.5, "HEARTBEAT_SECONDS": 0.05})
+    def test_heartbeat_keeps_a_long_job_leased(self):
+        job = JobService.enqueue("tests.slow", {"seconds": 1})
+        JobService.claim("test", 1)
+
+        self.assertEqual(JobService.run(job.id, "test"), "succeeded")
+        self.assertEqual(calls, [[]])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("succeeded", 1))
@@ -0,0 +1,9 @@
+from django.urls import path
+from modules.jobs.controllers.jobs_controller import JobsController
+
+jobs = JobsController.as_view
+
+urlpatterns = [
+    path("", jobs({"post": "create"})),
+    path("<uuid:pk>", jobs({"get": "retrieve"})),
+]
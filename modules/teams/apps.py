@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TeamsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "modules.teams"
+
+    def ready(self):
+        from modules.teams import signals  # noqa: F401
@@ -0,0 +1,43 @@
+from rest_framework.viewsets import ViewSet
+from rest_framework.response import Response
+from rest_framework import status, permissions
+
+from modules.teams.domain.exceptions import TeamNotFoundError, TeamPermissionDeniedError
+from modules.teams.serializers.teams_members_serializers import (
+    BulkMemberResultSerializer,
+    BulkMembersSerializer,
+)
+from modules.teams.services.teams_service import TeamService
+from modules.users.services.auth_service import AuthService
+
+
+class TeamsController(ViewSet):
+    permission_classes = [permissions.AllowAny]
+
+    def bulk_members(self, request, pk=None):
+        auth_header = request.headers.get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return Response({"detail": "Token missing"}, status=401)
+
+        token_data = AuthService.validate_token(auth_header.split(" ")[1])
+        if not token_data:
+            return Response({"detail": "Invalid token"}, status=401)
+
+        serializer = BulkMembersSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            results = TeamService.bulk_add_members(
+                team_id=pk,
+                members=serializer.validated_data["members"],
+                actor=token_data["user"],
+            )
+        except TeamNotFoundError:
+            return Response({"detail": "Team not found"}, status=404)
+        except TeamPermissionDeniedError:
+            return Response({"detail": "Not allowed"}, status=403)
+
+        return Response(
+            {"results": BulkMemberResultSerializer(results, many=True).data},
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,6 @@
+class TeamNotFoundError(Exception):
+    pass
+
+
+class TeamPermissionDeniedError(Exception):
+    pass
@@ -1,5 +1,6 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
+from django.dispatch import Signal
 
 
 USER_ROLE_CHOICES = (
@@ -17,6 +18,29 @@ USER_ROLE_CHOICES = (
 )
 
 
+# Sent with ``team_ids`` after QuerySet.update() soft-deletes or restores
+# teams or memberships; update() sends no post_save
+team_members_changed = Signal()
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    team_field = "team_id"
+
+    def update(self, **kwargs):
+        if "deleted_at" not in kwargs:
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            team_ids = set(self.values_list(self.team_field, flat=True))
+            rows = super().update(**kwargs)
+            if rows:
+                team_members_changed.send(sender=self.model, team_ids=team_ids)
+        return rows
+
+
+class TeamQuerySet(SoftDeleteQuerySet):
+    team_field = "id"
+
+
 class Team(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255)
@@ -27,6 +51,8 @@ class Team(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    objects = TeamQuerySet.as_manager()
+
     class Meta:
         app_label = "teams"
         db_table = "teams"
@@ -57,6 +83,11 @@ class Role(models.Model):
     class Meta:
         app_label = "teams"
         db_table = "roles"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "team", "role"], name="unique_user_team_role"
+            )
+        ]
 
     def __str__(self):
         user_value = getattr(self, "user_id", None) or getattr(self.user, "id", None)
@@ -81,6 +112,8 @@ class UserTeam(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    objects = SoftDeleteQuerySet.as_manager()
+
     class Meta:
         app_label = "teams"
         db_table = "user_teams"
@@ -94,3 +127,42 @@ class UserTeam(models.Model):
         user_value = getattr(self, "user_id", None) or getattr(self.user, "id", None)
         team_value = getattr(self, "team_id", None) or getattr(self.team, "id", None)
         return f"{user_value} - {team_value}"
+
+
+class Teammate(models.Model):
+    """
+    Adjacency row: ``teammate`` shares ``team`` with ``user``. Stored in both
+    directions and kept in sync with live UserTeam rows of live teams, so
+    reads need no join back to either table.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Covered by unique_teammate_edge, which starts with user
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_index=False,
+    )
+    teammate = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    team = models.ForeignKey(
+        "teams.Team",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    class Meta:
+        app_label = "teams"
+        db_table = "teammates"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "teammate", "team"], name="unique_teammate_edge"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.teammate_id} ({self.team_id})"
@@ -0,0 +1,30 @@
+import uuid
+
+from modules.jobs.registry import register_job
+from modules.teams.domain.models import Team
+
+# Handlers are registered at startup, so services and repositories are
+# imported inside them
+
+
+@register_job("teams.bulk_add_members")
+def bulk_add_members(context, team_id, members):
+    from modules.teams.services.teams_service import TeamService
+
+    members = [{**member, "user_id": uuid.UUID(str(member["user_id"]))} for member in members]
+    results = TeamService.bulk_add_members(team_id, members, actor=None)
+    context.progress(len(results), len(results))
+    return {"results": [{**result, "user_id": str(result["user_id"])} for result in results]}
+
+
+@register_job("teams.rebuild_teammates")
+def rebuild_teammates(context, team_ids=None):
+    """Recompute the teammates table for ``team_ids``, or for every team when omitted."""
+    from modules.teams.repository.teammates_repository import TeammatesRepository
+
+    if team_ids is None:
+        team_ids = [str(team_id) for team_id in Team.objects.values_list("id", flat=True)]
+    for index, team_id in enumerate(team_ids, start=1):
+        TeammatesRepository.rebuild_team(team_id)
+        context.progress(index, len(team_ids))
+    return {"teams": len(team_ids)}
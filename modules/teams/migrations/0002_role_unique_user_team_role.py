@@ -0,0 +1,33 @@
+# Generated by Django 4.2.20 on 2026-10-19 11:45
+
+from django.db import migrations, models
+
+
+def delete_duplicate_roles(apps, schema_editor):
+    # Keep one row per (user, team, role): the live one if any, else the
+    # most recently updated. Rows without a team never conflict.
+    Role = apps.get_model('teams', 'Role')
+    seen = set()
+    duplicates = []
+    roles = Role.objects.filter(team__isnull=False).order_by('user_id', 'team_id', 'role', models.F('deleted_at').asc(nulls_first=True), '-updated_at')
+    for role_id, key in ((row[0], row[1:]) for row in roles.values_list('id', 'user_id', 'team_id', 'role').iterator()):
+        if key in seen:
+            duplicates.append(role_id)
+        seen.add(key)
+    for start in range(0, len(duplicates), 500):
+        Role.objects.filter(id__in=duplicates[start:start + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_roles, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='role',
+            constraint=models.UniqueConstraint(fields=('user', 'team', 'role'), name='unique_user_team_role'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.20 on 2026-10-19 11:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def fill_teammates(apps, schema_editor):
+    UserTeam = apps.get_model('teams', 'UserTeam')
+    Teammate = apps.get_model('teams', 'Teammate')
+    members = {}
+    for team_id, user_id in UserTeam.objects.filter(deleted_at__isnull=True).values_list('team_id', 'user_id').iterator():
+        members.setdefault(team_id, []).append(user_id)
+    for team_id, user_ids in members.items():
+        Teammate.objects.bulk_create(
+            [
+                Teammate(user_id=user_id, teammate_id=teammate_id, team_id=team_id)
+                for user_id in user_ids
+                for teammate_id in user_ids
+                if user_id != teammate_id
+            ],
+            ignore_conflicts=True,
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_birthday_key_cohort_indexes'),
+        ('teams', '0002_role_unique_user_team_role'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Teammate',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='teams.team')),
+                ('teammate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='users.user')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='users.user')),
+            ],
+            options={
+                'db_table': 'teammates',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='teammate',
+            constraint=models.UniqueConstraint(fields=('user', 'teammate', 'team'), name='unique_teammate_edge'),
+        ),
+        migrations.RunPython(fill_teammates, migrations.RunPython.noop),
+    ]
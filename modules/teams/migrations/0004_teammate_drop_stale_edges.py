@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+def rebuild_teammates(apps, schema_editor):
+    # Reads no longer filter edges, so drop those left behind by soft deletes
+    # made through QuerySet.update() before they were synced
+    UserTeam = apps.get_model('teams', 'UserTeam')
+    Teammate = apps.get_model('teams', 'Teammate')
+    Teammate.objects.all().delete()
+    members = {}
+    live = UserTeam.objects.filter(deleted_at__isnull=True, team__deleted_at__isnull=True)
+    for team_id, user_id in live.values_list('team_id', 'user_id').iterator():
+        members.setdefault(team_id, []).append(user_id)
+    for team_id, user_ids in members.items():
+        Teammate.objects.bulk_create(
+            [
+                Teammate(user_id=user_id, teammate_id=teammate_id, team_id=team_id)
+                for user_id in user_ids
+                for teammate_id in user_ids
+                if user_id != teammate_id
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0003_teammate'),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_teammates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+import threading
+import time
+from typing import Dict, Iterable
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from modules.teams.domain.models import Team
+
+
+class TeamCatalog:
+    """
+    Process-local copy of the teams table keyed by id. Loaded in one query and
+    reloaded when the (max updated_at, count) stamp changes; the stamp is
+    re-checked at most every ``check_interval`` seconds.
+    """
+
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._teams: Dict[object, Team] = {}
+        self._stamp = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def get_many(self, team_ids: Iterable) -> Dict[object, Team]:
+        team_ids = set(team_ids)
+        self._refresh(force=not team_ids <= self._teams.keys())
+        teams = self._teams
+        return {team_id: teams[team_id] for team_id in team_ids if team_id in teams}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._teams, self._stamp, self._checked_at = {}, None, None
+
+    def _refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            stamp = Team.objects.aggregate(updated=Max("updated_at"), count=Count("id"))
+            stamp = (stamp["updated"], stamp["count"])
+            if stamp != self._stamp:
+                self._teams = {team.id: team for team in Team.objects.all()}
+                self._stamp = stamp
+            self._checked_at = now
+
+
+team_catalog = TeamCatalog(check_interval=getattr(settings, "TEAM_CATALOG_CHECK_INTERVAL", 5))
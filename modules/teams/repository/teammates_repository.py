@@ -0,0 +1,58 @@
+from typing import Dict, Iterable, List
+from django.db import transaction
+from django.db.models import Q
+from modules.teams.domain.models import Teammate, UserTeam
+
+
+class TeammatesRepository:
+
+    @staticmethod
+    def add_members(team_id, user_ids: Iterable) -> None:
+        new_ids = set(user_ids)
+        member_ids = set(
+            UserTeam.objects.filter(team_id=team_id, team__deleted_at__isnull=True, deleted_at__isnull=True)
+            .values_list("user_id", flat=True)
+        )
+        new_ids &= member_ids
+        edges = []
+        for user_id in new_ids:
+            for member_id in member_ids:
+                if member_id == user_id:
+                    continue
+                edges.append(Teammate(user_id=user_id, teammate_id=member_id, team_id=team_id))
+                if member_id not in new_ids:
+                    edges.append(Teammate(user_id=member_id, teammate_id=user_id, team_id=team_id))
+        Teammate.objects.bulk_create(edges, ignore_conflicts=True, batch_size=1000)
+
+    @staticmethod
+    def remove_member(team_id, user_id) -> None:
+        Teammate.objects.filter(Q(user_id=user_id) | Q(teammate_id=user_id), team_id=team_id).delete()
+
+    @staticmethod
+    def rebuild_team(team_id) -> None:
+        with transaction.atomic():
+            Teammate.objects.filter(team_id=team_id).delete()
+            member_ids = UserTeam.objects.filter(team_id=team_id, deleted_at__isnull=True).values_list("user_id", flat=True)
+            # add_members skips soft-deleted teams, which are left without edges
+            TeammatesRepository.add_members(team_id, list(member_ids))
+
+    @staticmethod
+    def get_teammates_page(user_id, after=None, limit: int = 50) -> Dict[object, List]:
+        """
+        Maps up to ``limit`` teammate ids after ``after``, in id order, to the
+        teams shared with ``user_id``. Edges only exist for live memberships of
+        live teams, so this is one range read of unique_teammate_edge.
+        """
+        page = Teammate.objects.filter(user_id=user_id)
+        if after is not None:
+            page = page.filter(teammate_id__gt=after)
+        page_ids = page.order_by("teammate_id").values("teammate_id").distinct()[:limit]
+        shared = {}
+        edges = (
+            Teammate.objects.filter(user_id=user_id, teammate_id__in=page_ids)
+            .order_by("teammate_id", "team_id")
+            .values_list("teammate_id", "team_id")
+        )
+        for teammate_id, team_id in edges:
+            shared.setdefault(teammate_id, []).append(team_id)
+        return shared
@@ -0,0 +1,103 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from modules.teams.domain.models import Role, Team, UserTeam
+from modules.teams.repository.teammates_repository import TeammatesRepository
+from modules.users.domain.models import User
+
+
+class TeamsRepository:
+
+    @staticmethod
+    def get_by_id(team_id) -> Optional[Team]:
+        return Team.objects.filter(id=team_id, deleted_at__isnull=True).first()
+
+    @staticmethod
+    def can_manage_users(team_id, user_id) -> bool:
+        return UserTeam.objects.filter(
+            team_id=team_id,
+            user_id=user_id,
+            deleted_at__isnull=True,
+            has_permission_manage_users=True,
+        ).exists()
+
+    @staticmethod
+    def get_existing_user_ids(user_ids: Iterable) -> Set:
+        return set(
+            User.objects.filter(id__in=list(user_ids), deleted_at__isnull=True)
+            .values_list("id", flat=True)
+        )
+
+    @staticmethod
+    def get_roles(user_ids: Iterable, team_ids: Iterable) -> List[Role]:
+        return list(
+            Role.objects.filter(
+                user_id__in=list(user_ids),
+                team_id__in=list(team_ids),
+                deleted_at__isnull=True,
+            ).order_by("role")
+        )
+
+    @staticmethod
+    def bulk_upsert_members(
+        team_id,
+        user_teams: List[UserTeam],
+        roles: List[Role],
+        permissions: Dict[Tuple[str, bool], List],
+    ) -> Tuple[Dict[object, str], Dict[Tuple[object, str], str]]:
+        """Inserts missing memberships and roles and revives soft-deleted ones.
+
+        ``permissions`` maps (flag, value) to the user ids that sent it; flags
+        that were not sent are left as they are. Returns the membership and
+        role statuses, keyed like the rows: added, revived or existing.
+        """
+        with transaction.atomic():
+            memberships = TeamsRepository._upsert(
+                UserTeam, team_id, user_teams, Q(user_id__in=[user_team.user_id for user_team in user_teams]),
+                key_fields=("user_id",),
+            )
+            for (field, value), user_ids in permissions.items():
+                UserTeam.objects.filter(team_id=team_id, user_id__in=user_ids).update(**{field: value})
+
+            user_ids_by_role = {}
+            for role in roles:
+                user_ids_by_role.setdefault(role.role, []).append(role.user_id)
+            role_match = Q(pk__in=[])
+            for role, user_ids in user_ids_by_role.items():
+                role_match |= Q(role=role, user_id__in=user_ids)
+            role_statuses = TeamsRepository._upsert(
+                Role, team_id, roles, role_match, key_fields=("user_id", "role"),
+            )
+
+            # bulk_create skips post_save, so inserted members are added to the
+            # teammate graph here; revived ones were resynced by the update
+            TeammatesRepository.add_members(team_id, list(memberships))
+        return memberships, role_statuses
+
+    @staticmethod
+    def _upsert(model, team_id, rows: List, match: Q, key_fields: Tuple[str, ...]) -> Dict:
+        """Statuses come from the writes rather than a read before them: the
+        revive stamps ``updated_at`` with this call's time, and an inserted row
+        keeps the id generated here, while a conflicting insert is skipped."""
+        def key(values):
+            return values[0] if len(key_fields) == 1 else tuple(values)
+
+        stamp = timezone.now()
+        model.objects.filter(match, team_id=team_id, deleted_at__isnull=False).update(
+            deleted_at=None, updated_at=stamp
+        )
+        model.objects.bulk_create(rows, ignore_conflicts=True)
+
+        new_ids = {key([getattr(row, field) for field in key_fields]): row.id for row in rows}
+        statuses = {}
+        for row_id, updated_at, *values in (
+            model.objects.filter(match, team_id=team_id).values_list("id", "updated_at", *key_fields)
+        ):
+            if row_id == new_ids.get(key(values)):
+                statuses[key(values)] = "added"
+            elif updated_at == stamp:
+                statuses[key(values)] = "revived"
+            else:
+                statuses[key(values)] = "existing"
+        return statuses
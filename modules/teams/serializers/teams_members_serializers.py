@@ -0,0 +1,40 @@
+from rest_framework import serializers
+
+from modules.teams.domain.models import USER_ROLE_CHOICES
+from modules.users.serializers.users_serializers import UserBriefSerializer
+
+
+class BulkMemberSerializer(serializers.Serializer):
+    user_id = serializers.UUIDField()
+    role = serializers.ChoiceField(choices=USER_ROLE_CHOICES)
+    # Left out of validated_data when not sent, so an existing membership keeps its flags
+    has_permission_manage_users = serializers.BooleanField(required=False)
+    has_permission_manage_projects = serializers.BooleanField(required=False)
+
+
+class BulkMembersSerializer(serializers.Serializer):
+    members = BulkMemberSerializer(many=True, allow_empty=False, max_length=500)
+
+
+class BulkMemberResultSerializer(serializers.Serializer):
+    user_id = serializers.UUIDField()
+    role = serializers.CharField()
+    # added, revived or existing for the membership; user_not_found skips the row
+    status = serializers.CharField()
+    # added, revived or existing for the role; null when the row was skipped
+    role_status = serializers.CharField(allow_null=True)
+
+
+class TeammateTeamSerializer(serializers.Serializer):
+    team_id = serializers.UUIDField()
+    roles = serializers.ListField(child=serializers.CharField())
+
+
+class TeammateSerializer(serializers.Serializer):
+    user = UserBriefSerializer()
+    teams = TeammateTeamSerializer(many=True)
+
+
+class TeammatesQuerySerializer(serializers.Serializer):
+    after = serializers.UUIDField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=200, default=50)
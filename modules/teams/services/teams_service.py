@@ -0,0 +1,104 @@
+from typing import List, Optional
+from modules.teams.domain.exceptions import TeamNotFoundError, TeamPermissionDeniedError
+from modules.teams.domain.models import Role, UserTeam
+from modules.teams.repository.teammates_repository import TeammatesRepository
+from modules.teams.repository.teams_repository import TeamsRepository
+from modules.users.domain.exceptions import UserNotFoundError
+from modules.users.domain.models import User
+from modules.users.repository.users_repository import UsersRepository
+
+PERMISSION_FLAGS = ("has_permission_manage_users", "has_permission_manage_projects")
+
+
+class TeamService:
+
+    @staticmethod
+    def bulk_add_members(team_id, members: List[dict], actor: Optional[User]) -> List[dict]:
+        """``actor`` is None for trusted callers such as background jobs."""
+        team = TeamsRepository.get_by_id(team_id)
+        if not team:
+            raise TeamNotFoundError(f"Team with id={team_id} not found")
+        if actor is not None and not actor.is_staff and not TeamsRepository.can_manage_users(team.id, actor.id):
+            raise TeamPermissionDeniedError("Not allowed to manage team members")
+
+        existing_ids = TeamsRepository.get_existing_user_ids(m["user_id"] for m in members)
+
+        user_teams = {}
+        roles = {}
+        flags = {}
+        for member in members:
+            user_id = member["user_id"]
+            if user_id not in existing_ids:
+                continue
+            # Duplicates in one payload would hit the same row twice in a
+            # single upsert statement, so the last entry wins
+            user_teams[user_id] = UserTeam(
+                user_id=user_id,
+                team_id=team.id,
+                has_permission_manage_users=member.get("has_permission_manage_users", False),
+                has_permission_manage_projects=member.get("has_permission_manage_projects", False),
+                deleted_at=None,
+            )
+            roles[(user_id, member["role"])] = Role(
+                user_id=user_id,
+                team_id=team.id,
+                role=member["role"],
+                deleted_at=None,
+            )
+            # Flags left out of the payload keep their stored value
+            for field in PERMISSION_FLAGS:
+                if field in member:
+                    flags.setdefault(user_id, {})[field] = member[field]
+
+        permissions = {}
+        for user_id, sent in flags.items():
+            for field, value in sent.items():
+                permissions.setdefault((field, value), []).append(user_id)
+
+        # Profiles and permissions are not cached, every request reads them
+        # from the database, so there is nothing to invalidate here
+        memberships, role_states = TeamsRepository.bulk_upsert_members(
+            team.id, list(user_teams.values()), list(roles.values()), permissions
+        )
+
+        results = []
+        for member in members:
+            user_id, role = member["user_id"], member["role"]
+            if user_id not in existing_ids:
+                results.append({"user_id": user_id, "role": role, "status": "user_not_found", "role_status": None})
+                continue
+            results.append({
+                "user_id": user_id,
+                "role": role,
+                "status": memberships[user_id],
+                "role_status": role_states[(user_id, role)],
+            })
+        return results
+
+    @staticmethod
+    def get_teammates(user_id, after=None, limit: int = 50) -> dict:
+        if not TeamsRepository.get_existing_user_ids([user_id]):
+            raise UserNotFoundError(f"User with id={user_id} not found")
+
+        shared = TeammatesRepository.get_teammates_page(user_id, after=after, limit=limit)
+        teammate_ids = list(shared)
+        users = {user.id: user for user in UsersRepository.get_many(teammate_ids)}
+        team_ids = {team_id for ids in shared.values() for team_id in ids}
+
+        roles = {}
+        for role in TeamsRepository.get_roles(teammate_ids, team_ids):
+            roles.setdefault((role.user_id, role.team_id), []).append(role.role)
+
+        teammates = [
+            {
+                "user": users[teammate_id],
+                "teams": [
+                    {"team_id": team_id, "roles": roles.get((teammate_id, team_id), [])}
+                    for team_id in shared[teammate_id]
+                ],
+            }
+            for teammate_id in teammate_ids
+            if teammate_id in users
+        ]
+        next_cursor = teammate_ids[-1] if len(teammate_ids) == limit else None
+        return {"teammates": teammates, "next": next_cursor}
@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from modules.teams.domain.models import Team, Teammate, UserTeam, team_members_changed
+from modules.teams.repository.teammates_repository import TeammatesRepository
+
+
+@receiver(post_save, sender=UserTeam)
+def sync_teammates_on_save(sender, instance, **kwargs):
+    if instance.deleted_at is None:
+        TeammatesRepository.add_members(instance.team_id, [instance.user_id])
+    else:
+        TeammatesRepository.remove_member(instance.team_id, instance.user_id)
+
+
+@receiver(post_delete, sender=UserTeam)
+def sync_teammates_on_delete(sender, instance, **kwargs):
+    TeammatesRepository.remove_member(instance.team_id, instance.user_id)
+
+
+@receiver(post_save, sender=Team)
+def sync_teammates_on_team_save(sender, instance, created, **kwargs):
+    if instance.deleted_at is not None:
+        Teammate.objects.filter(team_id=instance.id).delete()
+    elif not created and not Teammate.objects.filter(team_id=instance.id).exists():
+        # A restored team gets its edges back; a live team with none has at most one member
+        TeammatesRepository.rebuild_team(instance.id)
+
+
+@receiver(team_members_changed)
+def sync_teammates_on_update(sender, team_ids, **kwargs):
+    for team_id in team_ids:
+        TeammatesRepository.rebuild_team(team_id)
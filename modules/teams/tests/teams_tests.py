@@ -0,0 +1,209 @@
+import uuid
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from modules.teams.domain.models import Role, Team, Teammate, UserTeam
+from modules.teams.repository.teammates_repository import TeammatesRepository
+from modules.teams.services.teams_service import TeamService
+from modules.users.domain.models import User, UserAuthToken
+
+
+def make_team(name="Team"):
+    return Team.objects.create(name=name, educational_institution_type="university", city_id=uuid.uuid4())
+
+
+def make_user(email):
+    return User.objects.create_user(email, "secret")
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class BulkAddMembersTest(TestCase):
+
+    def setUp(self):
+        self.team = make_team()
+        self.manager = make_user("manager@example.com")
+        UserTeam.objects.create(user=self.manager, team=self.team, has_permission_manage_users=True)
+        self.members = [make_user(f"member{i}@example.com") for i in range(3)]
+
+    def _post(self, actor, members, team_id=None):
+        token = None
+        if actor is not None:
+            token, _ = UserAuthToken.objects.get_or_create(user=actor, deleted_at=None, defaults={"token": f"token-{actor.id}"})
+        return self.client.post(
+            f"/v1/teams/{team_id or self.team.id}/members:bulk",
+            {"members": members},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {token.token}" if token else "",
+        )
+
+    def test_statuses_reflect_what_the_upsert_did(self):
+        revived, existing, new = self.members
+        UserTeam.objects.create(user=revived, team=self.team, deleted_at=timezone.now())
+        Role.objects.create(user=revived, team=self.team, role="developer", deleted_at=timezone.now())
+        UserTeam.objects.create(user=existing, team=self.team)
+        Role.objects.create(user=existing, team=self.team, role="developer")
+        missing = uuid.uuid4()
+
+        response = self._post(self.manager, [
+            {"user_id": str(revived.id), "role": "developer"},
+            {"user_id": str(existing.id), "role": "developer"},
+            {"user_id": str(existing.id), "role": "designer", "has_permission_manage_projects": True},
+            {"user_id": str(new.id), "role": "pm"},
+            {"user_id": str(missing), "role": "pm"},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        statuses = [(r["status"], r["role_status"]) for r in response.json()["results"]]
+        self.assertEqual(statuses, [
+            ("revived", "revived"),
+            ("existing", "existing"),
+            ("existing", "added"),
+            ("added", "added"),
+            ("user_not_found", None),
+        ])
+        self.assertEqual(UserTeam.objects.filter(team=self.team, deleted_at__isnull=True).count(), 4)
+        self.assertTrue(UserTeam.objects.get(user=existing, team=self.team).has_permission_manage_projects)
+        self.assertEqual(
+            set(Role.objects.filter(team=self.team, deleted_at__isnull=True).values_list("user_id", "role")),
+            {(revived.id, "developer"), (existing.id, "developer"), (existing.id, "designer"), (new.id, "pm")},
+        )
+
+    def test_repeating_a_request_reports_existing_rows(self):
+        payload = [{"user_id": str(self.members[0].id), "role": "developer"}]
+        self._post(self.manager, payload)
+
+        results = self._post(self.manager, payload).json()["results"]
+
+        self.assertEqual((results[0]["status"], results[0]["role_status"]), ("existing", "existing"))
+        self.assertEqual(Role.objects.filter(user=self.members[0]).count(), 1)
+
+    def test_permission_flags_are_only_written_when_sent(self):
+        kept, granted, revoked = self.members
+        for user in self.members:
+            UserTeam.objects.create(user=user, team=self.team, has_permission_manage_users=True)
+
+        self._post(self.manager, [
+            {"user_id": str(kept.id), "role": "developer"},
+            {"user_id": str(granted.id), "role": "developer", "has_permission_manage_projects": True},
+            {"user_id": str(revoked.id), "role": "developer", "has_permission_manage_users": False},
+        ])
+
+        flags = {
+            user_id: (manage_users, manage_projects)
+            for user_id, manage_users, manage_projects in UserTeam.objects.filter(team=self.team).values_list(
+                "user_id", "has_permission_manage_users", "has_permission_manage_projects"
+            )
+        }
+        self.assertEqual(flags[kept.id], (True, False))
+        self.assertEqual(flags[granted.id], (True, True))
+        self.assertEqual(flags[revoked.id], (False, False))
+
+    def test_upsert_syncs_teammates(self):
+        self._post(self.manager, [{"user_id": str(user.id), "role": "developer"} for user in self.members[:2]])
+
+        edges = set(Teammate.objects.filter(team=self.team).values_list("user_id", "teammate_id"))
+        ids = [self.manager.id, self.members[0].id, self.members[1].id]
+        self.assertEqual(edges, {(a, b) for a in ids for b in ids if a != b})
+
+    def test_requires_manage_users_permission(self):
+        outsider = make_user("outsider@example.com")
+        payload = [{"user_id": str(self.members[0].id), "role": "developer"}]
+
+        self.assertEqual(self._post(None, payload).status_code, 401)
+        self.assertEqual(self._post(outsider, payload).status_code, 403)
+        self.assertFalse(UserTeam.objects.filter(user=self.members[0]).exists())
+
+    def test_unknown_team(self):
+        response = self._post(self.manager, [{"user_id": str(self.members[0].id), "role": "pm"}], team_id=uuid.uuid4())
+
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class TeammatesTest(TestCase):
+
+    def setUp(self):
+        self.team, self.other_team = make_team("A"), make_team("B")
+        self.user = make_user("user@example.com")
+        self.mates = sorted((make_user(f"mate{i}@example.com") for i in range(5)), key=lambda user: user.id)
+        for user in [self.user, *self.mates]:
+            UserTeam.objects.create(user=user, team=self.team)
+
+    def _teammate_ids(self):
+        return [teammate["user"].id for teammate in TeamService.get_teammates(self.user.id, limit=50)["teammates"]]
+
+    def test_signals_keep_edges_in_sync(self):
+        self.assertEqual(Teammate.objects.count(), 6 * 5)
+
+        membership = UserTeam.objects.get(user=self.mates[0], team=self.team)
+        membership.deleted_at = timezone.now()
+        membership.save()
+        self.assertEqual(Teammate.objects.count(), 5 * 4)
+
+        membership.deleted_at = None
+        membership.save()
+        self.assertEqual(Teammate.objects.count(), 6 * 5)
+
+        UserTeam.objects.get(user=self.mates[1], team=self.team).delete()
+        self.assertEqual(Teammate.objects.count(), 5 * 4)
+        self.assertNotIn(self.mates[1].id, self._teammate_ids())
+
+    def test_soft_deletes_through_update_resync_edges(self):
+        UserTeam.objects.filter(user=self.mates[0]).update(deleted_at=timezone.now())
+        self.assertEqual(self._teammate_ids(), [mate.id for mate in self.mates[1:]])
+        self.assertEqual(Teammate.objects.count(), 5 * 4)
+
+        Team.objects.filter(id=self.team.id).update(deleted_at=timezone.now())
+        self.assertEqual(self._teammate_ids(), [])
+        self.assertFalse(Teammate.objects.exists())
+
+        Team.objects.filter(id=self.team.id).update(deleted_at=None)
+        UserTeam.objects.filter(user=self.mates[0]).update(deleted_at=None)
+        self.assertEqual(Teammate.objects.count(), 6 * 5)
+
+    def test_team_soft_delete_through_save_drops_edges(self):
+        self.team.deleted_at = timezone.now()
+        self.team.save()
+        self.assertFalse(Teammate.objects.exists())
+
+        self.team.deleted_at = None
+        self.team.save()
+        self.assertEqual(Teammate.objects.count(), 6 * 5)
+
+    def test_teammates_page_is_one_query(self):
+        with self.assertNumQueries(1):
+            shared = TeammatesRepository.get_teammates_page(self.user.id, limit=3)
+        self.assertEqual(list(shared), [mate.id for mate in self.mates[:3]])
+
+    def test_requires_staff_token(self):
+        response = self.client.get(f"/v1/users/{self.user.id}/teammates")
+        self.assertEqual(response.status_code, 401)
+
+        response = self.client.get(f"/v1/users/{self.user.id}/teammates", HTTP_AUTHORIZATION="Bearer missing")
+        self.assertEqual(response.status_code, 401)
+
+    def test_keyset_pages_list_each_teammate_once_with_shared_teams(self):
+        UserTeam.objects.create(user=self.user, team=self.other_team)
+        UserTeam.objects.create(user=self.mates[2], team=self.other_team)
+        Role.objects.create(user=self.mates[2], team=self.other_team, role="pm")
+
+        staff = User.objects.create_user("staff@example.com", "secret", is_staff=True)
+        token = UserAuthToken.objects.create(user=staff, token="staff-token")
+
+        pages, after = [], ""
+        while after is not None:
+            response = self.client.get(
+                f"/v1/users/{self.user.id}/teammates",
+                {"limit": 2, **({"after": after} if after else {})},
+                HTTP_AUTHORIZATION=f"Bearer {token.token}",
+            )
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.json()["teammates"])
+            after = response.json()["next"]
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        teammates = [teammate for page in pages for teammate in page]
+        self.assertEqual([t["user"]["id"] for t in teammates], [str(mate.id) for mate in self.mates])
+        shared = {team["team_id"]: team["roles"] for team in teammates[2]["teams"]}
+        self.assertEqual(shared, {str(self.team.id): [], str(self.other_team.id): ["pm"]})
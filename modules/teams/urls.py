@@ -0,0 +1,8 @@
+from django.urls import path
+from modules.teams.controllers.teams_controller import TeamsController
+
+teams = TeamsController.as_view
+
+urlpatterns = [
+    path("<uuid:pk>/members:bulk", teams({"post": "bulk_members"})),
+]
@@ -2,8 +2,17 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status, permissions
 
+from modules.teams.serializers.teams_members_serializers import TeammateSerializer, TeammatesQuerySerializer
+from modules.teams.services.teams_service import TeamService
+from modules.users.permissions import staff_token_error
 from modules.users.serializers.auth_serializers import SignInSerializer
-from modules.users.serializers.users_serializers import UsersSerializer
+from modules.users.serializers.users_serializers import (
+    BirthdaysQuerySerializer,
+    CohortQuerySerializer,
+    SignedInUserSerializer,
+    UserBriefSerializer,
+    UsersSerializer,
+)
 from modules.users.services.auth_service import AuthService
 from modules.users.services.users_service import UserService
 from modules.users.domain.exceptions import InvalidCredentialsError, UserInactiveError, UserNotFoundError
@@ -33,7 +42,7 @@ class UsersController(ViewSet):
 
         return Response({
             "auth": result["auth"],
-            "user": UsersSerializer(result["user"]).data
+            "user": SignedInUserSerializer(result["user"]).data
         })
 
     def me(self, request):
@@ -57,3 +66,43 @@ class UsersController(ViewSet):
         except UserNotFoundError:
             return Response({"detail": "User not found"}, status=404)
         return Response({"user": UsersSerializer(user).data})
+
+    def birthdays(self, request):
+        error = staff_token_error(request)
+        if error:
+            return error
+
+        query = BirthdaysQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        users = UserService.get_upcoming_birthdays(**query.validated_data)
+        return Response({"users": UserBriefSerializer(users, many=True).data})
+
+    def cohort(self, request):
+        error = staff_token_error(request)
+        if error:
+            return error
+
+        query = CohortQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        users = UserService.get_cohort(**query.validated_data)
+        limit = query.validated_data["limit"]
+        return Response({
+            "users": UserBriefSerializer(users, many=True).data,
+            "next": str(users[-1].id) if len(users) == limit else None,
+        })
+
+    def teammates(self, request, pk=None):
+        error = staff_token_error(request)
+        if error:
+            return error
+
+        query = TeammatesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        try:
+            result = TeamService.get_teammates(pk, **query.validated_data)
+        except UserNotFoundError:
+            return Response({"detail": "User not found"}, status=404)
+        return Response({
+            "teammates": TeammateSerializer(result["teammates"], many=True).data,
+            "next": str(result["next"]) if result["next"] else None,
+        })
@@ -1,9 +1,39 @@
 import uuid
 from django.db import models
+from django.db.models.functions import Coalesce, ExtractDay, ExtractMonth
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 
 
-class UserManager(BaseUserManager):
+def birthday_key(value) -> int:
+    # month * 100 + day keeps Feb 29 between Feb 28 and Mar 1 in every year
+    return value.month * 100 + value.day
+
+
+class UserQuerySet(models.QuerySet):
+    """Keeps birthday_key in step with birth_date on the bulk write paths,
+    which skip User.save(). Raw SQL writes still have to set both."""
+
+    def update(self, **kwargs):
+        if "birth_date" in kwargs:
+            value = kwargs["birth_date"]
+            if hasattr(value, "resolve_expression"):
+                # Evaluated by the database, per row
+                kwargs["birthday_key"] = ExtractMonth(value) * 100 + ExtractDay(value)
+            else:
+                value = self.model._meta.get_field("birth_date").to_python(value)
+                kwargs["birthday_key"] = birthday_key(value) if value else None
+        return super().update(**kwargs)
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        if "birth_date" in fields:
+            objs = list(objs)
+            for obj in objs:
+                obj.birthday_key = birthday_key(obj.birth_date) if obj.birth_date else None
+            fields = [*fields, "birthday_key"]
+        return super().bulk_update(objs, fields, batch_size=batch_size)
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     def create_user(self, email, password=None, **extra_fields):
         if not email:
             raise ValueError("Email is required")
@@ -28,6 +58,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     first_name = models.CharField(max_length=255)
     last_name = models.CharField(max_length=255)
     birth_date = models.DateField(null=True, blank=True)
+    # Derived from birth_date by save() and by UserQuerySet.update()/bulk_update()
+    birthday_key = models.SmallIntegerField(null=True, blank=True, editable=False)
     email = models.EmailField(unique=True)
     password = models.CharField(max_length=255)
     phone = models.CharField(max_length=255, null=True, blank=True)
@@ -72,10 +104,23 @@ class User(AbstractBaseUser, PermissionsMixin):
     class Meta:
         app_label = "users"
         db_table = "users_user"
+        indexes = [
+            # id breaks ties, so limited birthday lists are stable
+            models.Index(fields=["birthday_key", "id"], name="users_birthday_key_idx"),
+            models.Index(fields=["admission_year", "id"], name="users_cohort_year_idx"),
+            models.Index(fields=["faculty", "id"], name="users_cohort_faculty_idx"),
+        ]
 
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        self.birthday_key = birthday_key(self.birth_date) if self.birth_date else None
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "birth_date" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "birthday_key"}
+        super().save(*args, **kwargs)
+
 
 class UserAuthToken(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -84,11 +129,21 @@ class UserAuthToken(models.Model):
     )
     token = models.TextField(unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(null=True, blank=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "user_auth_tokens"
         app_label = "users"
+        indexes = [
+            # Finds a newer token of the same user, which supersedes this one
+            models.Index(fields=["user", "created_at", "id"], name="user_tokens_newest_idx"),
+            models.Index(
+                Coalesce("last_used_at", "created_at"),
+                condition=models.Q(deleted_at__isnull=True),
+                name="live_tokens_last_active_idx",
+            )
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.id}"
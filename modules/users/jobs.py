@@ -0,0 +1,42 @@
+from modules.jobs.registry import register_job
+from modules.users.domain.models import User, birthday_key
+
+CHUNK_SIZE = 500
+
+# Handlers are registered at startup, so anything beyond the models is
+# imported inside them
+
+
+@register_job("users.revoke_tokens")
+def revoke_tokens(context, user_ids=None):
+    """Revoke live tokens of ``user_ids``, or of every user when omitted."""
+    from modules.users.repository.user_auth_token_repository import UserAuthTokenRepository
+
+    if user_ids is None:
+        user_ids = list(User.objects.values_list("id", flat=True))
+    revoked = 0
+    for start in range(0, len(user_ids), CHUNK_SIZE):
+        revoked += UserAuthTokenRepository.revoke_tokens_for_users(user_ids[start:start + CHUNK_SIZE])
+        context.progress(min(start + CHUNK_SIZE, len(user_ids)), len(user_ids), f"{revoked} tokens revoked")
+    return {"revoked": revoked}
+
+
+@register_job("users.recompute_birthday_keys")
+def recompute_birthday_keys(context):
+    queryset = User.objects.filter(birth_date__isnull=False).only("id", "birth_date").order_by("id")
+    total = queryset.count()
+    batch = []
+    done = 0
+    for user in queryset.iterator(chunk_size=CHUNK_SIZE):
+        user.birthday_key = birthday_key(user.birth_date)
+        batch.append(user)
+        if len(batch) >= CHUNK_SIZE:
+            User.objects.bulk_update(batch, ["birthday_key"])
+            done += len(batch)
+            batch = []
+            context.progress(done, total)
+    if batch:
+        User.objects.bulk_update(batch, ["birthday_key"])
+        done += len(batch)
+        context.progress(done, total)
+    return {"updated": done}
@@ -0,0 +1,89 @@
+import random
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from modules.users.domain.models import User, birthday_key
+from modules.users.services.users_service import UserService
+
+FACULTIES = [f"faculty-{i}" for i in range(20)]
+YEARS = list(range(2010, 2026))
+
+
+class Command(BaseCommand):
+    help = "Time the birthdays and cohort queries on growing directories in a throwaway database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="10000,100000,1000000",
+            help="Comma separated directory sizes; users are added until each size is reached.",
+        )
+        parser.add_argument("--repeat", type=int, default=50, help="Runs per query; the median is reported.")
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options["sizes"].split(","))
+        rng = random.Random(0)
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            self.stdout.write(f"{'users':>9} {'query':<28} {'rows':>5} {'median ms':>10}")
+            seeded = 0
+            for size in sizes:
+                started = time.perf_counter()
+                while seeded < size:
+                    count = min(options["batch_size"], size - seeded)
+                    User.objects.bulk_create(self._users(rng, seeded, count))
+                    seeded += count
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE")
+                self.stderr.write(f"seeded {size} users in {time.perf_counter() - started:.1f}s")
+                for name, query in self._queries(rng):
+                    rows, median = self._time(query, options["repeat"])
+                    self.stdout.write(f"{size:>9} {name:<28} {rows:>5} {median * 1000:>10.2f}")
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    @staticmethod
+    def _users(rng, offset, count):
+        users = []
+        for index in range(offset, offset + count):
+            birth_date = date(1995, 1, 1) + timedelta(days=rng.randrange(365 * 12))
+            users.append(User(
+                id=uuid.UUID(int=rng.getrandbits(128)),
+                email=f"user{index}@example.com",
+                password="!",
+                first_name="Bench",
+                last_name=str(index),
+                birth_date=birth_date,
+                birthday_key=birthday_key(birth_date),
+                faculty=rng.choice(FACULTIES),
+                admission_year=rng.choice(YEARS),
+            ))
+        return users
+
+    @staticmethod
+    def _queries(rng):
+        year_page = UserService.get_cohort(admission_year=2020, limit=100)
+        return [
+            ("birthdays days=14", lambda: UserService.get_upcoming_birthdays(14, 100, today=date(2026, 6, 1))),
+            ("birthdays wrap days=14", lambda: UserService.get_upcoming_birthdays(14, 100, today=date(2026, 12, 25))),
+            ("birthdays days=365", lambda: UserService.get_upcoming_birthdays(365, 500, today=date(2026, 6, 1))),
+            ("cohort year first page", lambda: UserService.get_cohort(admission_year=2020, limit=100)),
+            ("cohort year next page", lambda: UserService.get_cohort(admission_year=2020, after=year_page[-1].id, limit=100)),
+            ("cohort faculty first page", lambda: UserService.get_cohort(faculty=rng.choice(FACULTIES), limit=100)),
+        ]
+
+    @staticmethod
+    def _time(query, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = len(query())
+            timings.append(time.perf_counter() - started)
+        return rows, statistics.median(timings)
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, connections, reset_queries
+from django.test.utils import override_settings
+
+from modules.users.domain.models import User
+from modules.users.services.auth_service import AuthService
+
+EMAIL = "bench@example.com"
+PASSWORD = "bench-password"
+
+
+class Command(BaseCommand):
+    help = "Measure sign-ins per second and queries per sign-in against a throwaway database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=500, help="Sign-ins per thread.")
+        parser.add_argument("--threads", type=int, default=1)
+        parser.add_argument(
+            "--real-hasher",
+            action="store_true",
+            help="Keep the configured password hasher; by default a fast one isolates the database path.",
+        )
+
+    def handle(self, *args, **options):
+        hashers = None if options["real_hasher"] else ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with override_settings(**({"PASSWORD_HASHERS": hashers} if hashers else {})):
+                User.objects.create_user(EMAIL, PASSWORD, first_name="Bench", last_name="User")
+                queries = self._queries_per_sign_in()
+                elapsed = self._run(options["threads"], options["logins"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        total = options["threads"] * options["logins"]
+        self.stdout.write(f"queries per sign-in: {queries}")
+        self.stdout.write(f"sign-ins:            {total} in {elapsed:.2f}s ({total / elapsed:.0f}/s)")
+
+    @staticmethod
+    def _queries_per_sign_in() -> int:
+        AuthService.sign_in(EMAIL, PASSWORD)
+        with override_settings(DEBUG=True):
+            reset_queries()
+            AuthService.sign_in(EMAIL, PASSWORD)
+            return len(connection.queries)
+
+    @staticmethod
+    def _run(threads: int, logins: int) -> float:
+        barrier = threading.Barrier(threads + 1)
+
+        def worker():
+            barrier.wait()
+            try:
+                for _ in range(logins):
+                    AuthService.sign_in(EMAIL, PASSWORD)
+            finally:
+                connections.close_all()
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        return time.perf_counter() - started
@@ -0,0 +1,33 @@
+import io
+import pstats
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hrtech.profiling import profiles_dir
+
+
+class Command(BaseCommand):
+    help = "Aggregate sampled request profiles into per-route hotspot reports."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", type=Path, default=None, help="Profiles directory (defaults to PROFILING['DIR']).")
+        parser.add_argument("--route", default="", help="Only report routes containing this substring.")
+        parser.add_argument("--limit", type=int, default=20, help="Functions to show per route.")
+        parser.add_argument("--sort", default="cumulative", help="pstats sort key, e.g. cumulative or tottime.")
+
+    def handle(self, *args, **options):
+        root = options["dir"] or profiles_dir()
+        if not root.is_dir():
+            raise CommandError(f"No profiles found in {root}")
+
+        route_dirs = sorted(d for d in root.iterdir() if d.is_dir() and options["route"] in d.name)
+        for route_dir in route_dirs:
+            dumps = sorted(route_dir.glob("*.pstats"))
+            if not dumps:
+                continue
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{route_dir.name} ({len(dumps)} requests)"))
+            report = io.StringIO()
+            stats = pstats.Stats(*map(str, dumps), stream=report)
+            stats.strip_dirs().sort_stats(options["sort"]).print_stats(options["limit"])
+            self.stdout.write(report.getvalue())
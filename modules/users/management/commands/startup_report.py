@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from hrtech.startup import measure_cold_start
+
+
+class Command(BaseCommand):
+    help = "Measure cold start in a fresh interpreter: import-time tree, time to first request and peak RSS."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=None, help="URL requested as the first request.")
+        parser.add_argument("--min-ms", type=float, default=5.0, help="Hide imports cheaper than this (cumulative).")
+        parser.add_argument("--depth", type=int, default=3, help="Maximum import nesting depth to show.")
+
+    def handle(self, *args, **options):
+        report = measure_cold_start(options["path"])
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Import tree (cumulative ms / self ms)"))
+        for record in report.imports:
+            if record.depth > options["depth"] or record.cumulative_us / 1000 < options["min_ms"]:
+                continue
+            indent = "  " * record.depth
+            self.stdout.write(
+                f"{record.cumulative_us / 1000:9.1f} {record.self_us / 1000:8.1f}  {indent}{record.module}"
+            )
+
+        budget = settings.STARTUP_BUDGET_SECONDS
+        style = self.style.SUCCESS if report.first_request_seconds <= budget else self.style.ERROR
+        self.stdout.write(self.style.MIGRATE_HEADING("Summary"))
+        self.stdout.write(f"django.setup():      {report.setup_seconds:.3f}s")
+        self.stdout.write(style(f"first request:       {report.first_request_seconds:.3f}s (budget {budget:.3f}s)"))
+        self.stdout.write(f"peak RSS:            {report.max_rss_kb / 1024:.1f} MiB")
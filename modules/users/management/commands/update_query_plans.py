@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from hrtech import query_plans
+
+
+class Command(BaseCommand):
+    help = "Re-record repository query plan baselines against a seeded throwaway database."
+
+    def handle(self, *args, **options):
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            plans = query_plans.capture_plans(query_plans.seed())
+            query_plans.write_baselines(plans)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {len(plans)} {connection.vendor} plans to {query_plans.BASELINE_FILE}"
+        ))
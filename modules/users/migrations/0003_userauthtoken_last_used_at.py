@@ -0,0 +1,18 @@
+# Generated by Django 4.2.20 on 2026-10-19 11:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_team_userteam_role_user_teams_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userauthtoken',
+            name='last_used_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.20 on 2026-10-19 11:49
+
+from django.db import migrations, models
+
+
+def fill_birthday_key(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    batch = []
+    for user_id, birth_date in User.objects.filter(birth_date__isnull=False).values_list('id', 'birth_date').iterator():
+        batch.append(User(id=user_id, birthday_key=birth_date.month * 100 + birth_date.day))
+        if len(batch) >= 1000:
+            User.objects.bulk_update(batch, ['birthday_key'])
+            batch = []
+    if batch:
+        User.objects.bulk_update(batch, ['birthday_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_userauthtoken_last_used_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='birthday_key',
+            field=models.SmallIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.RunPython(fill_birthday_key, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['admission_year', 'id'], name='users_cohort_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['faculty', 'id'], name='users_cohort_faculty_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.20 on 2026-10-19 11:58
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def revoke_duplicate_live_tokens(apps, schema_editor):
+    UserAuthToken = apps.get_model('users', 'UserAuthToken')
+    seen = set()
+    duplicates = []
+    live = UserAuthToken.objects.filter(deleted_at__isnull=True).order_by('user_id', '-created_at')
+    for token_id, user_id in live.values_list('id', 'user_id').iterator():
+        if user_id in seen:
+            duplicates.append(token_id)
+        seen.add(user_id)
+    for start in range(0, len(duplicates), 500):
+        UserAuthToken.objects.filter(id__in=duplicates[start:start + 500]).update(deleted_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_birthday_key_cohort_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(revoke_duplicate_live_tokens, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='userauthtoken',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('user',), name='unique_live_token_per_user'),
+        ),
+    ]
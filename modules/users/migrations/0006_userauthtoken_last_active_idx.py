@@ -0,0 +1,18 @@
+# Generated by Django 4.2.20 on 2026-10-19 12:06
+
+from django.db import migrations, models
+import django.db.models.functions.comparison
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_userauthtoken_unique_live_token'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userauthtoken',
+            index=models.Index(django.db.models.functions.comparison.Coalesce('last_used_at', 'created_at'), condition=models.Q(('deleted_at__isnull', True)), name='live_tokens_last_active_idx'),
+        ),
+    ]
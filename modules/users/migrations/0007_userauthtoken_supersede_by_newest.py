@@ -0,0 +1,21 @@
+# Generated by Django 4.2.20 on 2026-10-19 12:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_userauthtoken_last_active_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='userauthtoken',
+            name='unique_live_token_per_user',
+        ),
+        migrations.AddIndex(
+            model_name='userauthtoken',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='user_tokens_newest_idx'),
+        ),
+    ]
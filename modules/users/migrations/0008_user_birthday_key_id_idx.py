@@ -0,0 +1,32 @@
+# Generated by Django 4.2.20 on 2026-10-19 12:44
+
+from django.db import migrations, models
+
+
+def recompute_birthday_keys(apps, schema_editor):
+    # Keys set before update() and bulk_update() maintained them may be stale
+    User = apps.get_model('users', 'User')
+    users = list(User.objects.filter(birth_date__isnull=False).only('id', 'birth_date', 'birthday_key'))
+    for user in users:
+        user.birthday_key = user.birth_date.month * 100 + user.birth_date.day
+    User.objects.bulk_update(users, ['birthday_key'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_userauthtoken_supersede_by_newest'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='birthday_key',
+            field=models.SmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['birthday_key', 'id'], name='users_birthday_key_idx'),
+        ),
+        migrations.RunPython(recompute_birthday_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+from typing import Optional
+
+from rest_framework.response import Response
+
+from modules.users.services.auth_service import AuthService
+
+
+def staff_token_error(request) -> Optional[Response]:
+    """Return an error response unless the Bearer token belongs to a staff user."""
+    auth_header = request.headers.get("Authorization")
+    if not auth_header or not auth_header.startswith("Bearer "):
+        return Response({"detail": "Token missing"}, status=401)
+    token_data = AuthService.validate_token(auth_header.split(" ")[1])
+    if not token_data:
+        return Response({"detail": "Invalid token"}, status=401)
+    if not token_data["user"].is_staff:
+        return Response({"detail": "Not allowed"}, status=403)
+    return None
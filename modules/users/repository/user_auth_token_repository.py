@@ -1,10 +1,26 @@
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from modules.users.domain.models import UserAuthToken
 
 
 class UserAuthTokenRepository:
 
+    @staticmethod
+    def _live():
+        """
+        Tokens neither revoked nor superseded. Issuing a token supersedes the
+        user's older ones without writing to them; the newest token, by
+        (created_at, id), is the live one.
+        """
+        same_user = UserAuthToken.objects.filter(user_id=OuterRef("user_id"))
+        # Two EXISTS rather than one OR, so each is a range search on user_tokens_newest_idx
+        later = Exists(same_user.filter(created_at__gt=OuterRef("created_at")))
+        tied = Exists(same_user.filter(created_at=OuterRef("created_at"), id__gt=OuterRef("id")))
+        return UserAuthToken.objects.filter(~later, ~tied, deleted_at__isnull=True)
+
     @staticmethod
     def create(token: UserAuthToken) -> UserAuthToken:
         token.save()
@@ -12,8 +28,36 @@ class UserAuthTokenRepository:
 
     @staticmethod
     def get_by_token(token_str: str) -> Optional[UserAuthToken]:
-        return UserAuthToken.objects.filter(token=token_str, deleted_at__isnull=True).first()
+        return UserAuthTokenRepository._live().filter(token=token_str).first()
 
     @staticmethod
     def revoke_tokens(user_id):
         UserAuthToken.objects.filter(user_id=user_id, deleted_at__isnull=True).update(deleted_at=timezone.now())
+
+    @staticmethod
+    def issue(user_id, token_str: str) -> UserAuthToken:
+        """Sign-in's only token write: one INSERT that supersedes older tokens."""
+        return UserAuthToken.objects.create(user_id=user_id, token=token_str)
+
+    @staticmethod
+    def revoke_tokens_for_users(user_ids: List) -> int:
+        return UserAuthToken.objects.filter(user_id__in=user_ids, deleted_at__isnull=True).update(deleted_at=timezone.now())
+
+    @staticmethod
+    def bulk_touch(last_used: Dict[object, datetime], batch_size: int = 500) -> None:
+        tokens = [UserAuthToken(id=token_id, last_used_at=used_at) for token_id, used_at in last_used.items()]
+        UserAuthToken.objects.bulk_update(tokens, ["last_used_at"], batch_size=batch_size)
+
+    @staticmethod
+    def get_inactive(since: datetime) -> List[UserAuthToken]:
+        """
+        Live tokens whose last activity, or creation if never used, is before
+        ``since``; reads live_tokens_last_active_idx in order.
+        """
+        return list(
+            UserAuthTokenRepository._live()
+            .alias(last_active=Coalesce("last_used_at", "created_at"))
+            .filter(last_active__lt=since)
+            .select_related("user")
+            .order_by("last_active")
+        )
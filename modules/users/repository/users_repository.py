@@ -1,36 +1,92 @@
-from typing import Optional
+from typing import Iterable, List, Optional
 from django.db.models import Prefetch
-from modules.teams.domain.models import Role, Team, UserTeam
+from modules.teams.domain.models import Role, UserTeam
+from modules.teams.repository.team_catalog import team_catalog
 from modules.users.domain.models import User
 
 
 class UsersRepository:
 
     @staticmethod
-    def _base_queryset():
-        roles_qs = Role.objects.filter(deleted_at__isnull=True).select_related("team")
-        user_teams_qs = (
-            UserTeam.objects.filter(deleted_at__isnull=True)
-            .select_related("team")
-        )
-        teams_qs = Team.objects.filter(deleted_at__isnull=True)
+    def _profile_prefetches():
+        # Teams are filled from the process-local catalog in _attach_teams
+        return [
+            Prefetch("roles", queryset=Role.objects.filter(deleted_at__isnull=True)),
+            Prefetch("user_teams", queryset=UserTeam.objects.filter(deleted_at__isnull=True)),
+        ]
 
+    @staticmethod
+    def _base_queryset():
         return (
             User.objects.filter(deleted_at__isnull=True)
-            .prefetch_related(
-                Prefetch("roles", queryset=roles_qs),
-                Prefetch("user_teams", queryset=user_teams_qs),
-                Prefetch("teams", queryset=teams_qs),
-            )
+            .prefetch_related(*UsersRepository._profile_prefetches())
         )
 
+    @staticmethod
+    def _attach_teams(user: Optional[User]) -> Optional[User]:
+        if user is None:
+            return None
+        roles = user.roles.all()
+        user_teams = user.user_teams.all()
+        teams = team_catalog.get_many(
+            {role.team_id for role in roles if role.team_id} | {user_team.team_id for user_team in user_teams}
+        )
+        for role in roles:
+            if role.team_id:
+                Role.team.field.set_cached_value(role, teams.get(role.team_id))
+        for user_team in user_teams:
+            UserTeam.team.field.set_cached_value(user_team, teams.get(user_team.team_id))
+
+        # Read by UsersSerializer instead of the teams relation
+        user.active_teams = [
+            user_team.team for user_team in user_teams
+            if user_team.team is not None and user_team.team.deleted_at is None
+        ]
+        return user
+
     @staticmethod
     def get_by_id(user_id) -> Optional[User]:
-        return UsersRepository._base_queryset().filter(id=user_id).first()
+        return UsersRepository._attach_teams(UsersRepository._base_queryset().filter(id=user_id).first())
 
     @staticmethod
     def get_by_email(email) -> Optional[User]:
-        return UsersRepository._base_queryset().filter(email=email).first()
+        return UsersRepository._attach_teams(UsersRepository._base_queryset().filter(email=email).first())
+
+    @staticmethod
+    def get_for_sign_in(email) -> Optional[User]:
+        return User.objects.filter(email=email, deleted_at__isnull=True).first()
+
+    @staticmethod
+    def get_many(user_ids: Iterable) -> List[User]:
+        return list(User.objects.filter(id__in=list(user_ids), deleted_at__isnull=True, is_active=True))
+
+    @staticmethod
+    def get_upcoming_birthdays(start_key: int, end_key: int, limit: int) -> List[User]:
+        # Keys wrap at the year boundary, e.g. Dec 25 -> Jan 7 is two range scans
+        if start_key <= end_key:
+            ranges = [(start_key, end_key)]
+        else:
+            ranges = [(start_key, 1231), (101, end_key)]
+
+        queryset = User.objects.filter(deleted_at__isnull=True, is_active=True)
+        users = []
+        for low, high in ranges:
+            remaining = limit - len(users)
+            if remaining <= 0:
+                break
+            users.extend(queryset.filter(birthday_key__range=(low, high)).order_by("birthday_key", "id")[:remaining])
+        return users
+
+    @staticmethod
+    def get_cohort(admission_year=None, faculty=None, after=None, limit: int = 100) -> List[User]:
+        queryset = User.objects.filter(deleted_at__isnull=True, is_active=True)
+        if admission_year is not None:
+            queryset = queryset.filter(admission_year=admission_year)
+        if faculty is not None:
+            queryset = queryset.filter(faculty=faculty)
+        if after is not None:
+            queryset = queryset.filter(id__gt=after)
+        return list(queryset.order_by("id")[:limit])
 
     @staticmethod
     def save(user: User) -> User:
@@ -9,7 +9,7 @@ from modules.users.domain.models import User
 
 
 class UsersSerializer(serializers.ModelSerializer):
-    teams = TeamSerializer(many=True, read_only=True)
+    teams = serializers.SerializerMethodField()
     roles = RoleSerializer(many=True, read_only=True)
     user_teams = UserTeamSerializer(many=True, read_only=True)
 
@@ -17,3 +17,56 @@ class UsersSerializer(serializers.ModelSerializer):
         model = User
         exclude = ["password", "is_superuser", "is_active", "is_staff", "deleted_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
+
+    def get_teams(self, user):
+        # UsersRepository attaches active_teams from the team catalog
+        teams = getattr(user, "active_teams", None)
+        if teams is None:
+            teams = user.teams.filter(deleted_at__isnull=True, user_teams__deleted_at__isnull=True)
+        return TeamSerializer(teams, many=True).data
+
+
+class SignedInUserSerializer(serializers.ModelSerializer):
+    """UsersSerializer without the relations, which sign-in does not load."""
+
+    class Meta:
+        model = User
+        exclude = [
+            "password", "is_superuser", "is_active", "is_staff", "deleted_at",
+            "groups", "user_permissions", "teams",
+        ]
+        read_only_fields = ["id", "created_at", "updated_at"]
+
+
+class UserBriefSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = (
+            "id",
+            "first_name",
+            "last_name",
+            "email",
+            "birth_date",
+            "faculty",
+            "admission_year",
+            "city",
+            "telegram_nick",
+        )
+        read_only_fields = fields
+
+
+class BirthdaysQuerySerializer(serializers.Serializer):
+    days = serializers.IntegerField(min_value=1, max_value=366, default=14)
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=100)
+
+
+class CohortQuerySerializer(serializers.Serializer):
+    admission_year = serializers.IntegerField(required=False)
+    faculty = serializers.CharField(required=False)
+    after = serializers.UUIDField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=100)
+
+    def validate(self, attrs):
+        if "admission_year" not in attrs and "faculty" not in attrs:
+            raise serializers.ValidationError("admission_year or faculty is required")
+        return attrs
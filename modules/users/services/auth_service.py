@@ -2,7 +2,7 @@ import uuid
 from typing import Optional
 from modules.users.repository.users_repository import UsersRepository
 from modules.users.repository.user_auth_token_repository import UserAuthTokenRepository
-from modules.users.domain.models import UserAuthToken
+from modules.users.services.token_activity_service import TokenActivityService
 from modules.users.domain.exceptions import UserNotFoundError, InvalidCredentialsError, UserInactiveError
 
 
@@ -10,7 +10,7 @@ class AuthService:
 
     @staticmethod
     def sign_in(email: str, password: str) -> dict:
-        user = UsersRepository.get_by_email(email)
+        user = UsersRepository.get_for_sign_in(email)
         if not user:
             raise UserNotFoundError("User does not exist")
         if not user.is_active:
@@ -18,12 +18,9 @@ class AuthService:
         if not user.check_password(password):
             raise InvalidCredentialsError("Wrong password")
 
-        UserAuthTokenRepository.revoke_tokens(user.id)
-
-        token_str = str(uuid.uuid4())
-        token = UserAuthToken(user=user, token=token_str)
-        UserAuthTokenRepository.create(token)
+        token = UserAuthTokenRepository.issue(user.id, str(uuid.uuid4()))
 
+        # Roles and teams are not loaded here; clients read them from /me
         return {
             "auth": {"token": token.token, "created_at": token.created_at},
             "user": user,
@@ -37,4 +34,5 @@ class AuthService:
         user = UsersRepository.get_by_id(token.user_id)
         if not user:
             return None
+        TokenActivityService.touch(token)
         return {"token": token.token, "created_at": token.created_at, "user": user}
@@ -0,0 +1,116 @@
+import atexit
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+from django.utils import timezone
+
+from modules.users.domain.models import UserAuthToken
+from modules.users.repository.user_auth_token_repository import UserAuthTokenRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TokenActivityBuffer:
+    """
+    Write-behind buffer for token last-used timestamps.
+
+    ``record`` only touches an in-memory dict; a daemon thread flushes the
+    pending timestamps with one bulk update every ``flush_interval`` seconds,
+    as soon as ``flush_size`` tokens are pending, and once more at exit.
+    A failed flush is logged and its timestamps are retried on the next one.
+    """
+
+    def __init__(self, flush_interval: float, flush_size: int):
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._pending: Dict[object, datetime] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._stopped = False
+
+    def record(self, token_id, used_at: datetime = None) -> None:
+        with self._lock:
+            self._pending[token_id] = used_at or timezone.now()
+            full = len(self._pending) >= self.flush_size
+        self._ensure_started()
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            UserAuthTokenRepository.bulk_touch(pending)
+        except Exception:
+            self._requeue(pending)
+            raise
+        return len(pending)
+
+    def reset(self) -> None:
+        """Drop pending timestamps, e.g. before a test database goes away."""
+        with self._lock:
+            self._pending = {}
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _requeue(self, pending: Dict[object, datetime]) -> None:
+        with self._lock:
+            for token_id, used_at in pending.items():
+                current = self._pending.get(token_id)
+                if current is None or current < used_at:
+                    self._pending[token_id] = used_at
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="token-activity-flusher", daemon=True)
+            self._thread.start()
+            atexit.register(self._flush_at_exit)
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Token activity flush failed, %d tokens requeued", len(self._pending))
+
+    def _flush_at_exit(self) -> None:
+        try:
+            self.flush()
+        except DatabaseError:
+            logger.exception("Dropped %d token activity updates at exit", len(self._pending))
+
+
+token_activity = TokenActivityBuffer(
+    flush_interval=getattr(settings, "TOKEN_ACTIVITY_FLUSH_INTERVAL", 30),
+    flush_size=getattr(settings, "TOKEN_ACTIVITY_FLUSH_SIZE", 1000),
+)
+
+
+class TokenActivityService:
+
+    @staticmethod
+    def touch(token: UserAuthToken) -> None:
+        token_activity.record(token.id)
+
+    @staticmethod
+    def get_inactive_tokens(since: datetime) -> List[UserAuthToken]:
+        token_activity.flush()
+        return UserAuthTokenRepository.get_inactive(since)
@@ -1,5 +1,8 @@
+from datetime import date, timedelta
+from typing import List
+from django.utils import timezone
 from modules.users.repository.users_repository import UsersRepository
-from modules.users.domain.models import User
+from modules.users.domain.models import User, birthday_key
 from modules.users.domain.exceptions import UserNotFoundError
 
 
@@ -15,3 +18,14 @@ class UserService:
         if not user:
             raise UserNotFoundError(f"User with id={user_id} not found")
         return user
+
+    @staticmethod
+    def get_upcoming_birthdays(days: int, limit: int, today: date = None) -> List[User]:
+        today = today or timezone.localdate()
+        # A full year (or more) covers every key up to the day before today
+        last_day = today + timedelta(days=days - 1) if days < 365 else today - timedelta(days=1)
+        return UsersRepository.get_upcoming_birthdays(birthday_key(today), birthday_key(last_day), limit)
+
+    @staticmethod
+    def get_cohort(admission_year=None, faculty=None, after=None, limit: int = 100) -> List[User]:
+        return UsersRepository.get_cohort(admission_year=admission_year, faculty=faculty, after=after, limit=limit)
@@ -0,0 +1,114 @@
+import io
+import tempfile
+import uuid
+from pathlib import Path
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.management import CommandError, call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import Resolver404, resolve
+
+from hrtech.profiling import SamplingProfilerMiddleware
+
+
+def profiling(directory, **options):
+    return override_settings(PROFILING={
+        "ENABLED": True,
+        "SAMPLE_RATE": 0.0,
+        "HEADER": "X-Profile",
+        "HEADER_TOKEN": "let-me-profile",
+        "ROUTES": [],
+        "DIR": directory,
+        "MAX_FILES_PER_ROUTE": 50,
+        **options,
+    })
+
+
+class SamplingProfilerMiddlewareTest(SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = Path(directory.name)
+        self.factory = RequestFactory()
+
+    def _dumps(self):
+        return sorted(p.relative_to(self.dir).as_posix() for p in self.dir.rglob("*.pstats"))
+
+    def _middleware(self):
+        def respond(request):
+            # Resolves like Django's handler does, which the middleware wraps
+            try:
+                request.resolver_match = resolve(request.path_info)
+            except Resolver404:
+                pass
+            return HttpResponse("ok")
+
+        return SamplingProfilerMiddleware(respond)
+
+    def test_disabled_middleware_is_not_used(self):
+        with override_settings(PROFILING={"ENABLED": False}):
+            with self.assertRaises(MiddlewareNotUsed):
+                self._middleware()
+
+    def test_profiles_only_with_matching_header_token(self):
+        with profiling(self.dir):
+            middleware = self._middleware()
+            middleware(self.factory.get("/v1/users/me"))
+            middleware(self.factory.get("/v1/users/me", HTTP_X_PROFILE="wrong"))
+            self.assertEqual(self._dumps(), [])
+
+            response = middleware(self.factory.get("/v1/users/me", HTTP_X_PROFILE="let-me-profile"))
+
+        self.assertEqual(response.content, b"ok")
+        self.assertEqual([dump.split("/")[0] for dump in self._dumps()], ["v1_users_me"])
+
+    def test_profiles_matching_routes(self):
+        with profiling(self.dir, ROUTES=[r"^/v1/teams/"]):
+            middleware = self._middleware()
+            middleware(self.factory.get("/v1/users/me"))
+            middleware(self.factory.post(f"/v1/teams/{uuid.uuid4()}/members:bulk"))
+
+        self.assertEqual([dump.split("/")[0] for dump in self._dumps()], ["v1_teams_uuid_pk_members_bulk"])
+
+    def test_unresolved_paths_share_one_directory(self):
+        with profiling(self.dir, ROUTES=[r"^/"]):
+            middleware = self._middleware()
+            for path in ["/missing", "/wp-login.php", f"/v1/teams/{uuid.uuid4()}/nope"]:
+                middleware(self.factory.get(path))
+
+        self.assertEqual({dump.split("/")[0] for dump in self._dumps()}, {"unresolved"})
+
+    def test_keeps_newest_dumps_per_route(self):
+        with profiling(self.dir, ROUTES=[r"^/"], MAX_FILES_PER_ROUTE=2):
+            middleware = self._middleware()
+            for _ in range(4):
+                middleware(self.factory.get("/v1/users/me"))
+            middleware(self.factory.get("/v1/users/cohort"))
+
+        dumps = self._dumps()
+        self.assertEqual(len([d for d in dumps if d.startswith("v1_users_me/")]), 2)
+        self.assertEqual(len([d for d in dumps if d.startswith("v1_users_cohort/")]), 1)
+
+
+class ProfileReportTest(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = Path(directory.name)
+
+    def test_reports_hotspots_per_resolved_route(self):
+        with profiling(self.dir, ROUTES=[r"^/v1/users/"]):
+            self.client.get("/v1/users/me")
+
+        output = io.StringIO()
+        call_command("profile_report", "--dir", str(self.dir), "--limit", "5", stdout=output)
+
+        self.assertIn("v1_users_me (1 requests)", output.getvalue())
+        self.assertIn("function calls", output.getvalue())
+
+    def test_missing_directory(self):
+        with self.assertRaises(CommandError):
+            call_command("profile_report", "--dir", str(self.dir / "missing"), stdout=io.StringIO())
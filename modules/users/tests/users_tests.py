@@ -0,0 +1,354 @@
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.db import DatabaseError, connection, connections
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from hrtech import query_plans
+from hrtech.startup import measure_cold_start
+from modules.analytics.repository.analytics_repository import AnalyticsRepository
+from modules.jobs.repository.jobs_repository import JobsRepository
+from modules.teams.domain.models import Role, Team, UserTeam
+from modules.teams.repository.team_catalog import team_catalog
+from modules.teams.repository.teammates_repository import TeammatesRepository
+from modules.teams.repository.teams_repository import TeamsRepository
+from modules.teams.serializers.teams_serializers import RoleSerializer
+from modules.users.domain.models import User, UserAuthToken, birthday_key
+from modules.users.repository.users_repository import UsersRepository
+from modules.users.repository.user_auth_token_repository import UserAuthTokenRepository
+from modules.users.services.auth_service import AuthService
+from modules.users.services.token_activity_service import TokenActivityBuffer, token_activity
+from modules.users.services.users_service import UserService
+from modules.users.serializers.users_serializers import SignedInUserSerializer, UsersSerializer
+
+
+class RepositoryQueryPlansTest(TestCase):
+    """
+    Compares EXPLAIN output of repository queries with hrtech/query_plans.json.
+    Re-record baselines with ``python manage.py update_query_plans``.
+    """
+
+    def test_no_plan_regressions(self):
+        baselines = query_plans.load_baselines().get(connection.vendor)
+        if baselines is None:
+            self.skipTest(f"No {connection.vendor} baselines, run update_query_plans")
+
+        current = query_plans.capture_plans(query_plans.seed())
+
+        self.assertEqual(sorted(current), sorted(baselines), "Repository query set changed")
+        for name, plans in current.items():
+            with self.subTest(query=name):
+                self.assertEqual(query_plans.find_regressions(baselines[name], plans), [])
+
+    def test_every_repository_method_is_registered(self):
+        probe = dict.fromkeys(["user", "users", "team", "token", "job"], mock.MagicMock())
+        # Variants such as get_cohort.faculty count for their method
+        registered = {".".join(name.split(".")[:2]) for name in query_plans.repository_queries(probe)}
+        repositories = [
+            AnalyticsRepository, JobsRepository, TeammatesRepository, TeamsRepository,
+            UserAuthTokenRepository, UsersRepository,
+        ]
+        methods = {
+            f"{repository.__name__}.{name}"
+            for repository in repositories
+            for name, value in vars(repository).items()
+            if isinstance(value, staticmethod) and not name.startswith("_")
+        }
+        self.assertEqual(methods - registered, set())
+
+
+class UpcomingBirthdaysTest(TestCase):
+
+    def setUp(self):
+        for born in ["1999-12-27", "2000-12-30", "2001-01-02", "2002-01-05", "2000-02-29", "2001-03-01", "2003-06-14"]:
+            User.objects.create(email=f"{born}@example.com", first_name="Born", last_name=born, birth_date=date.fromisoformat(born))
+
+    def _birthdays(self, days, today, limit=100):
+        return [str(user.birth_date) for user in UserService.get_upcoming_birthdays(days, limit, today=today)]
+
+    def test_window_wraps_past_new_year(self):
+        self.assertEqual(self._birthdays(7, date(2026, 12, 28)), ["2000-12-30", "2001-01-02"])
+        self.assertEqual(self._birthdays(7, date(2026, 12, 28), limit=1), ["2000-12-30"])
+
+    def test_feb_29_birthdays_fall_between_feb_28_and_mar_1(self):
+        self.assertEqual(self._birthdays(2, date(2027, 2, 28)), ["2000-02-29", "2001-03-01"])
+        self.assertEqual(self._birthdays(1, date(2028, 2, 29)), ["2000-02-29"])
+        self.assertEqual(self._birthdays(1, date(2027, 3, 1)), ["2001-03-01"])
+
+    def test_a_year_or_more_returns_everyone_from_today(self):
+        expected = ["2003-06-14", "1999-12-27", "2000-12-30", "2001-01-02", "2002-01-05", "2000-02-29", "2001-03-01"]
+        self.assertEqual(self._birthdays(365, date(2026, 6, 14)), expected)
+        self.assertEqual(self._birthdays(366, date(2026, 6, 14)), expected)
+        self.assertEqual(self._birthdays(364, date(2026, 6, 15)), expected[1:])
+
+    def test_shared_birthdays_are_ordered_by_id(self):
+        twins = [
+            User.objects.create(email=f"twin{i}@example.com", first_name="Twin", last_name=str(i), birth_date=date(2004, 8, 1))
+            for i in range(4)
+        ]
+        expected = sorted(user.id for user in twins)
+
+        users = UserService.get_upcoming_birthdays(1, 2, today=date(2026, 8, 1))
+
+        self.assertEqual([user.id for user in users], expected[:2])
+
+    def test_bulk_writes_keep_birthday_key_in_step(self):
+        users = User.objects.order_by("id")
+        first, second, third = users[0], users[1], users[2]
+
+        User.objects.filter(id=first.id).update(birth_date=date(2001, 7, 4))
+        User.objects.filter(id=second.id).update(birth_date="2001-11-05")
+        User.objects.filter(id=third.id).update(birthday_key=0)
+        User.objects.filter(id=third.id).update(birth_date=F("birth_date"))
+        self.assertEqual(
+            dict(User.objects.filter(id__in=[first.id, second.id, third.id]).values_list("id", "birthday_key")),
+            {first.id: 704, second.id: 1105, third.id: birthday_key(third.birth_date)},
+        )
+
+        first.birth_date, second.birth_date = date(1990, 1, 9), None
+        User.objects.bulk_update([first, second], ["birth_date"])
+        self.assertEqual(User.objects.get(id=first.id).birthday_key, 109)
+        self.assertIsNone(User.objects.get(id=second.id).birthday_key)
+
+    def test_directory_endpoints_require_staff_token(self):
+        member = User.objects.create(email="member@example.com", first_name="Member", last_name="Test")
+        staff = User.objects.create(email="staff@example.com", first_name="Staff", last_name="Test", is_staff=True)
+        UserAuthToken.objects.create(user=member, token="member-token")
+        UserAuthToken.objects.create(user=staff, token="staff-token")
+
+        for url in ["/v1/users/birthdays?days=7", "/v1/users/cohort?admission_year=2020"]:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 401)
+                self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION="Bearer member-token").status_code, 403)
+                self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION="Bearer staff-token").status_code, 200)
+
+
+class ProfileTeamsTest(TestCase):
+
+    def setUp(self):
+        team_catalog.clear()
+        self.addCleanup(team_catalog.clear)
+        self.user = User.objects.create(email="member@example.com", first_name="Member", last_name="Test")
+        self.team = self._join("Alpha")
+
+    def _join(self, name):
+        team = Team.objects.create(name=name, educational_institution_type="university", city_id=uuid.uuid4())
+        UserTeam.objects.create(user=self.user, team=team)
+        Role.objects.create(user=self.user, team=team, role="developer")
+        return team
+
+    def _profile(self):
+        return UsersSerializer(UsersRepository.get_by_id(self.user.id)).data
+
+    def _profile_team_names(self):
+        return [team["name"] for team in self._profile()["teams"]]
+
+    def test_warm_profile_read_is_three_queries(self):
+        self._profile_team_names()
+
+        # User, roles and memberships; teams come from the warm catalog
+        with self.assertNumQueries(3):
+            user = UsersRepository.get_by_id(self.user.id)
+        with self.assertNumQueries(0):
+            teams = UsersSerializer().get_teams(user)
+            roles = RoleSerializer(user.roles.all(), many=True).data
+        self.assertEqual([team["name"] for team in teams], ["Alpha"])
+        self.assertEqual([role["team"]["name"] for role in roles], ["Alpha"])
+
+    def test_catalog_reloads_when_stamp_changes(self):
+        self.assertEqual(self._profile_team_names(), ["Alpha"])
+
+        with mock.patch.object(team_catalog, "check_interval", 0):
+            self.team.name = "Renamed"
+            self.team.save()
+            profile = self._profile()
+            self.assertEqual([team["name"] for team in profile["teams"]], ["Renamed"])
+            self.assertEqual([role["team"]["name"] for role in profile["roles"]], ["Renamed"])
+
+            self.team.deleted_at = timezone.now()
+            self.team.save()
+            self.assertEqual(self._profile_team_names(), [])
+
+    def test_unknown_team_forces_reload(self):
+        self._profile_team_names()
+
+        with mock.patch.object(team_catalog, "check_interval", float("inf")):
+            self._join("Beta")
+            self.assertEqual(sorted(self._profile_team_names()), ["Alpha", "Beta"])
+
+    def test_fallback_skips_soft_deleted_memberships(self):
+        beta = self._join("Beta")
+        UserTeam.objects.filter(user=self.user, team=beta).update(deleted_at=timezone.now())
+
+        # A user loaded without the repository has no active_teams attached
+        teams = UsersSerializer().get_teams(User.objects.get(id=self.user.id))
+
+        self.assertEqual([team["name"] for team in teams], ["Alpha"])
+
+
+class ColdStartBudgetTest(SimpleTestCase):
+
+    def test_first_request_within_budget(self):
+        # Fastest of a few runs, so a busy host does not fail the budget
+        fastest = min(measure_cold_start().first_request_seconds for _ in range(3))
+        self.assertLessEqual(
+            fastest,
+            settings.STARTUP_BUDGET_SECONDS,
+            "Cold start over budget, inspect it with `python manage.py startup_report`",
+        )
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class SignInConcurrencyTest(TransactionTestCase):
+
+    def setUp(self):
+        User.objects.create_user("member@example.com", "secret", first_name="Member", last_name="Test")
+
+    def _sign_in_concurrently(self, attempts):
+        barrier = threading.Barrier(attempts)
+        tokens, errors = [], []
+
+        def sign_in():
+            barrier.wait()
+            try:
+                tokens.append(AuthService.sign_in("member@example.com", "secret")["auth"]["token"])
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=sign_in) for _ in range(attempts)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        return tokens
+
+    def _live_tokens(self):
+        tokens = UserAuthToken.objects.values_list("token", flat=True)
+        return [token for token in tokens if UserAuthTokenRepository.get_by_token(token)]
+
+    def test_concurrent_sign_ins_leave_one_live_token(self):
+        issued = []
+        for _ in range(2):
+            tokens = self._sign_in_concurrently(8)
+            issued.extend(tokens)
+
+            live = self._live_tokens()
+            self.assertEqual(len(live), 1)
+            self.assertIn(live[0], tokens)
+            self.assertIsNotNone(AuthService.validate_token(live[0]))
+
+        # Superseded tokens are kept, not overwritten
+        self.assertEqual(sorted(UserAuthToken.objects.values_list("token", flat=True)), sorted(issued))
+
+    def test_sign_in_supersedes_previous_token(self):
+        self.addCleanup(token_activity.reset)
+        old = AuthService.sign_in("member@example.com", "secret")["auth"]["token"]
+        self.assertIsNotNone(AuthService.validate_token(old))
+
+        new = AuthService.sign_in("member@example.com", "secret")["auth"]["token"]
+        token_activity.flush()
+
+        # A pending touch of the old token stays on the old row
+        self.assertIsNone(AuthService.validate_token(old))
+        self.assertIsNotNone(UserAuthToken.objects.get(token=old).last_used_at)
+        self.assertIsNone(UserAuthToken.objects.get(token=new).last_used_at)
+        self.assertEqual(self._live_tokens(), [new])
+
+    def test_revoked_token_is_not_live(self):
+        token = AuthService.sign_in("member@example.com", "secret")["auth"]["token"]
+        UserAuthTokenRepository.revoke_tokens(UserAuthToken.objects.get(token=token).user_id)
+
+        self.assertIsNone(AuthService.validate_token(token))
+
+    def test_sign_in_is_one_read_and_one_write(self):
+        AuthService.sign_in("member@example.com", "secret")
+
+        with self.assertNumQueries(2):
+            result = AuthService.sign_in("member@example.com", "secret")
+        with self.assertNumQueries(0):
+            SignedInUserSerializer(result["user"]).data
+
+
+class TokenActivityBufferTest(TransactionTestCase):
+
+    def setUp(self):
+        user = User.objects.create_user("member@example.com", "secret")
+        self.tokens = [
+            UserAuthToken.objects.create(user=user, token="revoked", deleted_at=timezone.now()),
+            UserAuthToken.objects.create(user=user, token="live"),
+        ]
+
+    def _buffer(self, **kwargs):
+        buffer = TokenActivityBuffer(**{"flush_interval": 60, "flush_size": 1000, **kwargs})
+        self.addCleanup(buffer.stop)
+        return buffer
+
+    def _wait_for(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("Timed out waiting for the flusher")
+            time.sleep(0.01)
+
+    def _touched(self):
+        return UserAuthToken.objects.filter(last_used_at__isnull=False).count()
+
+    def test_flushes_when_size_threshold_is_reached(self):
+        buffer = self._buffer(flush_size=2)
+        buffer.record(self.tokens[0].id)
+        time.sleep(0.05)
+        self.assertEqual(self._touched(), 0)
+
+        buffer.record(self.tokens[1].id)
+        self._wait_for(lambda: self._touched() == 2)
+
+    def test_flushes_on_interval(self):
+        buffer = self._buffer(flush_interval=0.05)
+        buffer.record(self.tokens[1].id)
+        self._wait_for(lambda: self._touched() == 1)
+
+    def test_failed_flush_is_requeued_keeping_newest_timestamp(self):
+        buffer = self._buffer()
+        token_id = self.tokens[1].id
+        older, newer = timezone.now() - timedelta(minutes=5), timezone.now()
+        buffer.record(token_id, older)
+
+        def fail_after_new_touch(pending, *args, **kwargs):
+            buffer.record(token_id, newer)
+            raise DatabaseError("database is down")
+
+        with mock.patch.object(UserAuthTokenRepository, "bulk_touch", side_effect=fail_after_new_touch):
+            with self.assertRaises(DatabaseError):
+                buffer.flush()
+
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(UserAuthToken.objects.get(id=token_id).last_used_at, newer)
+
+    def test_flusher_logs_failures(self):
+        buffer = self._buffer(flush_interval=0.05)
+        with mock.patch.object(UserAuthTokenRepository, "bulk_touch", side_effect=DatabaseError("database is down")):
+            with self.assertLogs("modules.users.services.token_activity_service", "ERROR"):
+                buffer.record(self.tokens[1].id)
+                time.sleep(0.2)
+        self._wait_for(lambda: self._touched() == 1)
+
+    def test_exit_flush_writes_pending_and_swallows_database_errors(self):
+        buffer = self._buffer()
+        buffer.record(self.tokens[1].id)
+        buffer._flush_at_exit()
+        self.assertEqual(self._touched(), 1)
+
+        buffer.record(self.tokens[1].id)
+        with mock.patch.object(UserAuthTokenRepository, "bulk_touch", side_effect=DatabaseError("no such table")):
+            with self.assertLogs("modules.users.services.token_activity_service", "ERROR"):
+                buffer._flush_at_exit()
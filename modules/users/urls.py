@@ -6,5 +6,8 @@ users = UsersController.as_view
 urlpatterns = [
     path("token", users({"post": "token"})),
     path("me", users({"get": "me"})),
-    path("<uuid:pk>", users({"get": "retrieve"}))
+    path("birthdays", users({"get": "birthdays"})),
+    path("cohort", users({"get": "cohort"})),
+    path("<uuid:pk>", users({"get": "retrieve"})),
+    path("<uuid:pk>/teammates", users({"get": "teammates"})),
 ]